@@ -1,9 +1,12 @@
 import logging
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+import threading
+from functools import partial
 import torch
 import re
 from datetime import datetime
 import warnings
+from dedupe import group_near_duplicates
+from relevance import compile_keywords
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
@@ -11,15 +14,128 @@ logging.getLogger("transformers").setLevel(logging.ERROR)
 
 logger = logging.getLogger(__name__)
 
+# Pipelines behind each analyzer attribute, loaded on first use
+MODEL_SPECS = {
+    'sentiment_analyzer': {
+        'label': 'sentiment analyzer',
+        'task': 'sentiment-analysis',
+        'model': 'ProsusAI/finbert',
+        'tokenizer': 'ProsusAI/finbert',
+        'fallback': 'Keyword-based fallback'
+    },
+    'summarizer': {
+        'label': 'summarizer',
+        'task': 'summarization',
+        'model': 'facebook/bart-large-cnn',
+        'fallback': 'Text truncation fallback'
+    },
+    'classifier': {
+        'label': 'classifier',
+        'task': 'zero-shot-classification',
+        'model': 'facebook/bart-large-mnli',
+        'fallback': 'Keyword-based fallback'
+    },
+    'embedder': {
+        'label': 'embedding categorizer',
+        'task': 'feature-extraction',
+        'model': 'sentence-transformers/all-MiniLM-L6-v2',
+        'fallback': 'Keyword-based fallback'
+    }
+}
+
+# Categorizer modes: 9 NLI passes per article, or one embedding pass compared to category prototypes
+ZERO_SHOT = 'zero-shot'
+EMBEDDING = 'embedding'
+CATEGORIZER_MODELS = {ZERO_SHOT: 'classifier', EMBEDDING: 'embedder'}
+
+NOT_LOADED = 'not_loaded'
+LOADING = 'loading'
+LOADED = 'loaded'
+FAILED = 'failed'
+
+# Candidate labels for zero-shot categorization
+CATEGORIES = [
+    "Market News",
+    "Company Earnings",
+    "Economic Indicators",
+    "Central Bank Policy",
+    "Cryptocurrency",
+    "Commodities",
+    "Mergers & Acquisitions",
+    "IPO News",
+    "Regulatory News"
+]
+
+# Keywords per category, used by the keyword fallback and to describe categories to the embedder
+CATEGORY_KEYWORDS = {
+    "Market News": ["market", "trading", "dow", "nasdaq", "s&p", "index"],
+    "Company Earnings": ["earnings", "revenue", "profit", "quarterly", "results"],
+    "Economic Indicators": ["gdp", "inflation", "unemployment", "cpi", "ppi"],
+    "Central Bank Policy": ["fed", "federal reserve", "interest rate", "monetary policy"],
+    "Cryptocurrency": ["bitcoin", "crypto", "blockchain", "ethereum", "digital currency"],
+    "Commodities": ["oil", "gold", "silver", "commodity", "crude", "natural gas"],
+    "Mergers & Acquisitions": ["merger", "acquisition", "takeover", "buyout"],
+    "IPO News": ["ipo", "initial public offering", "going public", "debut"],
+    "Regulatory News": ["sec", "regulation", "compliance", "investigation"]
+}
+
+# Whole-word matchers for shortlisting zero-shot labels ("fed" must not match "FedEx")
+CATEGORY_PATTERNS = {category: compile_keywords(keywords) for category, keywords in CATEGORY_KEYWORDS.items()}
+
+# Broad label added to short keyword shortlists so the model always has a general alternative
+FALLBACK_CATEGORY = "Market News"
+
+def _model_property(name):
+    """Analyzer attribute that loads its pipeline the first time it is read"""
+    def getter(self):
+        return self._get_model(name)
+
+    def setter(self, value):
+        with self._model_locks[name]:
+            self._models[name] = value
+            self._model_states[name] = LOADED if value is not None else FAILED
+
+    return property(getter, setter)
+
 class AIAnalyzer:
-    def __init__(self):
-        self.sentiment_analyzer = None
-        self.summarizer = None
-        self.classifier = None
+    sentiment_analyzer = _model_property('sentiment_analyzer')
+    summarizer = _model_property('summarizer')
+    classifier = _model_property('classifier')
+    embedder = _model_property('embedder')
+
+    def __init__(self, batch_size=8, lazy=True, warm_up=False, categorizer=ZERO_SHOT,
+                 label_top_k=3, confident_keywords=2):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
 
+        # Category model in use; the other categorizer's model is never loaded
+        if categorizer not in CATEGORIZER_MODELS:
+            raise ValueError(f"Unknown categorizer {categorizer!r}, expected one of {list(CATEGORIZER_MODELS)}")
+        self.categorizer = categorizer
+        unused = {name for mode, name in CATEGORIZER_MODELS.items() if mode != categorizer}
+        self.active_models = [name for name in MODEL_SPECS if name not in unused]
+        self._category_vectors = None
+
+        # Zero-shot only scores the top-k keyword candidates (None scores all labels);
+        # a lone category matched by confident_keywords distinct keywords skips the model
+        self.label_top_k = label_top_k
+        self.confident_keywords = confident_keywords
+        self.label_stats = {'articles': 0, 'skipped': 0, 'nli_passes': 0}
+        self._label_lock = threading.Lock()
+
+        # Models load on first use (or all at once with lazy=False); warm_up loads them in the background
+        self._models = {}
+        self._model_states = {name: NOT_LOADED for name in MODEL_SPECS}
+        self._model_locks = {name: threading.Lock() for name in MODEL_SPECS}
+        self._warm_up_thread = None
+
+        # Texts sent through each pipeline together; 1 analyzes articles one at a time
+        self.batch_size = batch_size
+
         # Initialize models
-        self.load_models()
+        if not lazy:
+            self.load_models()
+        elif warm_up:
+            self.start_warm_up()
 
         # Financial keywords for importance scoring
         self.high_importance_keywords = [
@@ -36,46 +152,79 @@ class AIAnalyzer:
         ]
 
     def load_models(self):
-        """Load free Hugging Face models"""
+        """Load every model now instead of on first use"""
+        logger.info("Loading AI models... This may take a few minutes on first run.")
+
+        for name in self.active_models:
+            self._get_model(name)
+
+        if all(self._model_states[name] == LOADED for name in self.active_models):
+            logger.info("✅ All AI models loaded successfully!")
+        else:
+            logger.info("Falling back to basic analysis for models that failed to load")
+
+    def start_warm_up(self):
+        """Load the models in a background thread so the first analysis does not wait"""
+        if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+            self._warm_up_thread = threading.Thread(target=self.load_models, name='model-warm-up', daemon=True)
+            self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def is_ready(self):
+        """True once every model has finished loading (or failed and fallen back)"""
+        return all(self._model_states[name] in (LOADED, FAILED) for name in self.active_models)
+
+    def _get_model(self, name):
+        """Pipeline for name, loading it on first use; None if it could not be loaded"""
+        if self._model_states[name] in (LOADED, FAILED):
+            return self._models.get(name)
+
+        # Concurrent callers (e.g. the warm-up thread and a request) wait for the same load
+        with self._model_locks[name]:
+            if self._model_states[name] not in (LOADED, FAILED):
+                self._model_states[name] = LOADING
+                self._models[name] = self._load_model(name)
+                self._model_states[name] = LOADED if self._models[name] is not None else FAILED
+
+        return self._models.get(name)
+
+    def _load_model(self, name):
+        """Load one free Hugging Face model"""
+        spec = MODEL_SPECS[name]
         try:
-            logger.info("Loading AI models... This may take a few minutes on first run.")
-
-            # Load sentiment analysis model (financial domain)
-            logger.info("Loading sentiment analyzer...")
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="ProsusAI/finbert",
-                tokenizer="ProsusAI/finbert",
-                device=0 if self.device == "cuda" else -1
+            # Imported here so read-only users of the analyzer do not pay for transformers at startup
+            from transformers import pipeline
+
+            logger.info(f"Loading {spec['label']}...")
+            options = {'tokenizer': spec['tokenizer']} if spec.get('tokenizer') else {}
+            return pipeline(
+                spec['task'],
+                model=spec['model'],
+                device=0 if self.device == "cuda" else -1,
+                **options
             )
 
-            # Load summarization model
-            logger.info("Loading summarizer...")
-            self.summarizer = pipeline(
-                "summarization",
-                model="facebook/bart-large-cnn",
-                device=0 if self.device == "cuda" else -1
-            )
+        except Exception as e:
+            logger.error(f"Error loading {spec['label']}: {e}")
+            logger.info(f"Falling back to {spec['fallback'].lower()} for the {spec['label']}")
+            return None
 
-            # Load text classification for news categorization
-            logger.info("Loading classifier...")
-            self.classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=0 if self.device == "cuda" else -1
-            )
+    def analyze_articles(self, articles, dedupe=True, batch_size=None):
+        """Analyze a list of articles.
 
-            logger.info("✅ All AI models loaded successfully!")
+        With dedupe enabled, near-identical copies of a story (e.g. the same
+        wire piece syndicated by several sources) are analyzed once and the
+        results copied to the other copies. With a batch size above 1 the
+        models run on length-bucketed batches (see analyze_batched).
+        """
+        batch_size = batch_size or self.batch_size
+
+        if dedupe and len(articles) > 1:
+            return self.analyze_deduplicated(articles, batch_size)
+
+        if batch_size > 1 and len(articles) > 1:
+            return self.analyze_batched(articles, batch_size)
 
-        except Exception as e:
-            logger.error(f"Error loading models: {e}")
-            logger.info("Falling back to basic analysis without AI models")
-            self.sentiment_analyzer = None
-            self.summarizer = None
-            self.classifier = None
-
-    def analyze_articles(self, articles):
-        """Analyze a list of articles"""
         analyzed_articles = []
 
         for i, article in enumerate(articles):
@@ -96,6 +245,129 @@ class AIAnalyzer:
 
         return analyzed_articles
 
+    def analyze_deduplicated(self, articles, batch_size=None):
+        """Analyze one representative per near-duplicate group and copy its scores"""
+        groups = group_near_duplicates(articles)
+        representatives = [articles[group[0]] for group in groups]
+
+        duplicates = len(articles) - len(groups)
+        if duplicates:
+            logger.info(f"Skipping analysis of {duplicates} near-duplicate articles")
+
+        analyzed = self.analyze_articles(representatives, dedupe=False, batch_size=batch_size)
+
+        for group, result in zip(groups, analyzed):
+            for i in group[1:]:
+                for field in ('sentiment_score', 'importance_score', 'category', 'summary'):
+                    articles[i][field] = result.get(field)
+                articles[i]['duplicate_of'] = result.get('url')
+
+        return articles
+
+    def analyze_batched(self, articles, batch_size=None):
+        """Analyze articles with each model run on batches of similar-length texts.
+
+        Texts are sorted by token length and cut into buckets of batch_size,
+        so padding inside a batch stays small. Results are put back in
+        article order. If a batch fails, its texts are retried one at a time
+        with the single-article methods.
+        """
+        batch_size = batch_size or self.batch_size
+        logger.info(f"Analyzing {len(articles)} articles in batches of {batch_size}...")
+
+        titles = [article.get('title', '') for article in articles]
+        contents = [article.get('content', '') for article in articles]
+        full_texts = [f"{title}. {content}".strip() for title, content in zip(titles, contents)]
+
+        # Sentiment (same truncation as analyze_sentiment)
+        sentiments = [0.0] * len(articles)
+        if self.sentiment_analyzer:
+            indices = [i for i, text in enumerate(full_texts) if text]
+            texts = [full_texts[i][:512] for i in indices]
+            results = self._run_batched(
+                lambda batch: [self._sentiment_score(result) for result in
+                               self.sentiment_analyzer(batch, batch_size=len(batch), truncation=True)],
+                texts, self.sentiment_analyzer, batch_size, self.analyze_sentiment
+            )
+            for i, score in zip(indices, results):
+                sentiments[i] = score
+        else:
+            sentiments = [self.keyword_sentiment_analysis(text) for text in full_texts]
+
+        categories = self.categorize_articles(articles, batch_size)
+
+        # Summaries: only long enough texts go to the model, the rest use generate_summary's fallback
+        summaries = [None] * len(articles)
+        if self.summarizer:
+            indices = [i for i, text in enumerate(full_texts) if text and len(text.split()) > 50]
+            texts = [full_texts[i][:1000] for i in indices]
+            results = self._run_batched(
+                lambda batch: [result['summary_text'] for result in
+                               self.summarizer(batch, max_length=150, min_length=50,
+                                               do_sample=False, batch_size=len(batch))],
+                texts, self.summarizer, batch_size, self.generate_summary
+            )
+            for i, summary in zip(indices, results):
+                summaries[i] = summary
+
+        analyzed_articles = []
+        for i, article in enumerate(articles):
+            try:
+                article['sentiment_score'] = sentiments[i]
+                article['importance_score'] = self.calculate_importance_score(titles[i], contents[i])
+                article['category'] = categories[i]
+                article['summary'] = summaries[i] if summaries[i] is not None else self.generate_summary(full_texts[i])
+
+            except Exception as e:
+                logger.error(f"Error analyzing article: {e}")
+                article['sentiment_score'] = 0.0
+                article['importance_score'] = 0.5
+                article['category'] = 'General'
+                article['summary'] = article.get('content', '')[:200] + '...'
+
+            analyzed_articles.append(article)
+
+        return analyzed_articles
+
+    def _run_batched(self, run_batch, texts, model, batch_size, fallback):
+        """Apply run_batch to length-sorted buckets of texts, returning results in input order"""
+        results = [None] * len(texts)
+
+        for bucket in self._length_buckets(texts, model, batch_size):
+            batch = [texts[i] for i in bucket]
+            try:
+                outputs = run_batch(batch)
+                if len(outputs) != len(batch):
+                    raise ValueError(f"expected {len(batch)} results, got {len(outputs)}")
+            except Exception as e:
+                logger.error(f"Batch of {len(batch)} failed, analyzing one at a time: {e}")
+                outputs = [fallback(text) for text in batch]
+
+            for i, output in zip(bucket, outputs):
+                results[i] = output
+
+        return results
+
+    def _length_buckets(self, texts, model, batch_size):
+        """Indices of texts sorted by token length and split into batches"""
+        lengths = self._token_lengths(texts, model)
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+        return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+    def _token_lengths(self, texts, model):
+        """Token count per text using the pipeline's tokenizer, or word count without one"""
+        tokenizer = getattr(model, 'tokenizer', None)
+        if tokenizer is not None and texts:
+            try:
+                return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)['input_ids']]
+            except Exception as e:
+                logger.error(f"Error tokenizing texts for batching: {e}")
+        return [len(text.split()) for text in texts]
+
+    def _as_list(self, results):
+        # Pipelines return a bare dict instead of a list for a single input
+        return [results] if isinstance(results, dict) else results
+
     def analyze_single_article(self, article):
         """Analyze a single article"""
         title = article.get('title', '')
@@ -132,17 +404,7 @@ class AIAnalyzer:
                 text = text[:512]
 
                 result = self.sentiment_analyzer(text)
-
-                # Convert to numeric score (-1 to 1)
-                label = result[0]['label'].lower()
-                confidence = result[0]['score']
-
-                if 'positive' in label:
-                    return confidence
-                elif 'negative' in label:
-                    return -confidence
-                else:  # neutral
-                    return 0.0
+                return self._sentiment_score(result[0])
             else:
                 # Fallback sentiment analysis using keywords
                 return self.keyword_sentiment_analysis(text)
@@ -151,6 +413,18 @@ class AIAnalyzer:
             logger.error(f"Error in sentiment analysis: {e}")
             return 0.0
 
+    def _sentiment_score(self, result):
+        """Convert a sentiment pipeline result to a numeric score (-1 to 1)"""
+        label = result['label'].lower()
+        confidence = result['score']
+
+        if 'positive' in label:
+            return confidence
+        elif 'negative' in label:
+            return -confidence
+        else:  # neutral
+            return 0.0
+
     def keyword_sentiment_analysis(self, text):
         """Fallback sentiment analysis using keywords"""
         positive_words = [
@@ -208,23 +482,11 @@ class AIAnalyzer:
     def categorize_article(self, title, content):
         """Categorize article into financial categories"""
         try:
-            if self.classifier:
-                text = f"{title}. {content}"[:512]
-
-                categories = [
-                    "Market News",
-                    "Company Earnings", 
-                    "Economic Indicators",
-                    "Central Bank Policy",
-                    "Cryptocurrency",
-                    "Commodities",
-                    "Mergers & Acquisitions",
-                    "IPO News",
-                    "Regulatory News"
-                ]
-
-                result = self.classifier(text, categories)
-                return result['labels'][0]  # Return top category
+            if self._category_model():
+                label, candidates = self.shortlist_categories(title, content)
+                if label:
+                    return label
+                return self._categorize_text(f"{title}. {content}"[:512], candidates)
             else:
                 # Fallback categorization using keywords
                 return self.keyword_categorization(title, content)
@@ -233,23 +495,147 @@ class AIAnalyzer:
             logger.error(f"Error in categorization: {e}")
             return "General"
 
+    def categorize_articles(self, articles, batch_size=None):
+        """Category for each article, running the categorizer on length-bucketed batches"""
+        titles = [article.get('title', '') for article in articles]
+        contents = [article.get('content', '') for article in articles]
+
+        category_model = self._category_model()
+        if not category_model:
+            return [self.keyword_categorization(title, content) for title, content in zip(titles, contents)]
+
+        categories = [None] * len(articles)
+
+        # Articles sharing a shortlist go through the classifier together
+        groups = {}
+        for i, (title, content) in enumerate(zip(titles, contents)):
+            label, candidates = self.shortlist_categories(title, content)
+            if label:
+                categories[i] = label
+            else:
+                groups.setdefault(tuple(candidates), []).append(i)
+
+        for candidates, indices in groups.items():
+            # Same input as categorize_article
+            texts = [f"{titles[i]}. {contents[i]}"[:512] for i in indices]
+            labels = list(candidates)
+            results = self._run_batched(partial(self._categorize_batch, labels=labels), texts, category_model,
+                                        batch_size or self.batch_size, partial(self._categorize_text, labels=labels))
+            for i, category in zip(indices, results):
+                categories[i] = category
+
+        return categories
+
+    def keyword_category_hits(self, title, content):
+        """Distinct whole-word keywords found per category, as (all, in_title) sets"""
+        title = title or ''
+        content = content or ''
+
+        hits = {}
+        for category, pattern in CATEGORY_PATTERNS.items():
+            found = {match.lower() for match in pattern.findall(f"{title} {content}")}
+            if found:
+                hits[category] = (found, {match.lower() for match in pattern.findall(title)})
+        return hits
+
+    def shortlist_categories(self, title, content):
+        """Candidate labels for zero-shot classification, pruned with keyword scores.
+
+        Returns (label, candidates). When exactly one category matches, with
+        at least `confident_keywords` distinct keywords, label is that category
+        and the model is skipped. Otherwise candidates holds up to `label_top_k`
+        best-scoring categories plus FALLBACK_CATEGORY, so a lone weak match
+        is never forced on the model. Only an article without any keyword hit
+        is scored against every label. Only zero-shot is pruned; the
+        embedding categorizer is one pass either way.
+        """
+        if self.categorizer != ZERO_SHOT:
+            return None, CATEGORIES
+        if not self.label_top_k:
+            self._count_label_passes(len(CATEGORIES))
+            return None, CATEGORIES
+
+        hits = self.keyword_category_hits(title, content)
+
+        if len(hits) == 1:
+            category, (found, _) = next(iter(hits.items()))
+            if len(found) >= self.confident_keywords:
+                self._count_label_passes(0)
+                return category, [category]
+
+        if not hits:
+            self._count_label_passes(len(CATEGORIES))
+            return None, CATEGORIES
+
+        # Title matches count double when ranking
+        scores = {category: len(found) + len(in_title) for category, (found, in_title) in hits.items()}
+        ranked = sorted(scores, key=lambda category: (-scores[category], CATEGORIES.index(category)))
+        candidates = ranked[:self.label_top_k]
+        if len(candidates) < self.label_top_k and FALLBACK_CATEGORY not in candidates:
+            candidates.append(FALLBACK_CATEGORY)
+
+        # Keep the registry order so identical shortlists batch together
+        candidates = [category for category in CATEGORIES if category in candidates]
+        self._count_label_passes(len(candidates))
+        return None, candidates
+
+    def _count_label_passes(self, passes):
+        with self._label_lock:
+            self.label_stats['articles'] += 1
+            self.label_stats['nli_passes'] += passes
+            if passes == 0:
+                self.label_stats['skipped'] += 1
+
+    def _category_model(self):
+        """Pipeline behind the configured categorizer, or None if it failed to load"""
+        return self._get_model(CATEGORIZER_MODELS[self.categorizer])
+
+    def _categorize_text(self, text, labels=CATEGORIES):
+        """Top category for already prepared text"""
+        try:
+            return self._categorize_batch([text], labels)[0]
+        except Exception as e:
+            logger.error(f"Error in categorization: {e}")
+            return "General"
+
+    def _categorize_batch(self, texts, labels=CATEGORIES):
+        """Top category among labels for each prepared text with the configured categorizer"""
+        if self.categorizer == EMBEDDING:
+            similarities = self._embed(texts) @ self._category_embeddings().T
+            return [CATEGORIES[i] for i in similarities.argmax(dim=1).tolist()]
+
+        if len(labels) == 1:
+            return [labels[0]] * len(texts)
+
+        results = self._as_list(self.classifier(texts, labels, batch_size=len(texts)))
+        return [result['labels'][0] for result in results]  # Return top category
+
+    def _embed(self, texts):
+        """Unit-length sentence vectors for texts, mean-pooled over real (non-padding) tokens"""
+        embedder = self.embedder
+        inputs = embedder.tokenizer(texts, padding=True, truncation=True, return_tensors='pt')
+        inputs = {key: value.to(embedder.model.device) for key, value in inputs.items()}
+
+        # One forward pass for the whole batch
+        with torch.no_grad():
+            token_vectors = embedder.model(**inputs)[0]
+
+        mask = inputs['attention_mask'].unsqueeze(-1).to(token_vectors.dtype)
+        vectors = (token_vectors * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return torch.nn.functional.normalize(vectors, dim=-1).cpu()
+
+    def _category_embeddings(self):
+        """One vector per category, embedded once from its name and keywords"""
+        if self._category_vectors is None:
+            descriptions = [f"{category}: {', '.join(CATEGORY_KEYWORDS[category])}" for category in CATEGORIES]
+            self._category_vectors = self._embed(descriptions)
+        return self._category_vectors
+
     def keyword_categorization(self, title, content):
         """Fallback categorization using keywords"""
         text = f"{title} {content}".lower()
 
-        category_keywords = {
-            "Market News": ["market", "trading", "dow", "nasdaq", "s&p", "index"],
-            "Company Earnings": ["earnings", "revenue", "profit", "quarterly", "results"],
-            "Economic Indicators": ["gdp", "inflation", "unemployment", "cpi", "ppi"],
-            "Central Bank Policy": ["fed", "federal reserve", "interest rate", "monetary policy"],
-            "Cryptocurrency": ["bitcoin", "crypto", "blockchain", "ethereum", "digital currency"],
-            "Commodities": ["oil", "gold", "silver", "commodity", "crude", "natural gas"],
-            "Mergers & Acquisitions": ["merger", "acquisition", "takeover", "buyout"],
-            "IPO News": ["ipo", "initial public offering", "going public", "debut"],
-            "Regulatory News": ["sec", "regulation", "compliance", "investigation"]
-        }
-
-        for category, keywords in category_keywords.items():
+        for category, keywords in CATEGORY_KEYWORDS.items():
             if any(keyword in text for keyword in keywords):
                 return category
 
@@ -289,10 +675,24 @@ class AIAnalyzer:
             return text
 
     def get_model_info(self):
-        """Get information about loaded models"""
-        return {
-            "sentiment_analyzer": "ProsusAI/finbert" if self.sentiment_analyzer else "Keyword-based fallback",
-            "summarizer": "facebook/bart-large-cnn" if self.summarizer else "Text truncation fallback",
-            "classifier": "facebook/bart-large-mnli" if self.classifier else "Keyword-based fallback",
-            "device": self.device
-        }
+        """Get information about loaded models, without triggering any loads"""
+        info = {}
+        for name in self.active_models:
+            spec = MODEL_SPECS[name]
+            state = self._model_states[name]
+            if state == LOADED:
+                info[name] = spec['model']
+            elif state == FAILED:
+                info[name] = spec['fallback']
+            else:
+                info[name] = f"{spec['model']} ({state.replace('_', ' ')})"
+
+        info["device"] = self.device
+        info["ready"] = self.is_ready()
+        info["categorizer"] = self.categorizer
+        with self._label_lock:
+            passes = dict(self.label_stats)
+        passes['nli_passes_without_pruning'] = passes['articles'] * len(CATEGORIES)
+        info["label_pruning"] = passes
+        info["status"] = {name: self._model_states[name] for name in self.active_models}
+        return info
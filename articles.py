@@ -0,0 +1,103 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+class LazyArticle(dict):
+    """Article dict whose 'content' is only extracted on first access.
+
+    Title, URL and dates are stored up front; the costly HTML cleanup in
+    `loader` runs the first time anything reads 'content' (directly, via
+    get(), or by iterating/serializing the whole record). Articles dropped
+    by earlier filters therefore never pay for it.
+    """
+
+    def __init__(self, loader, **fields):
+        super().__init__(**fields)
+        self._loader = loader
+
+    @property
+    def is_loaded(self):
+        return self._loader is None
+
+    def materialize(self):
+        """Run the content loader now if it has not run yet"""
+        if self._loader is None:
+            return self
+
+        loader, self._loader = self._loader, None
+        try:
+            content = loader()
+        except Exception as e:
+            logger.error(f"Error extracting content for {dict.get(self, 'url')}: {e}")
+            content = ''
+        dict.__setitem__(self, 'content', content)
+        return self
+
+    def __missing__(self, key):
+        if key == 'content' and self._loader is not None:
+            return self.materialize()['content']
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'content':
+            self.materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        return (key == 'content' and self._loader is not None) or dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        if key == 'content':
+            # An explicit value replaces whatever the loader would have produced
+            self._loader = None
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if key == 'content' and self._loader is not None:
+            self._loader = None
+            return
+        dict.__delitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        # Route through __setitem__ so an incoming 'content' cancels the loader
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key == 'content':
+            self.materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        return dict.popitem(self.materialize())
+
+    # Whole-record views need every field, so they materialize first
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def __reduce__(self):
+        # Pickle (e.g. across process boundaries) as a plain, fully loaded dict
+        return (dict, (dict(self.items()),))
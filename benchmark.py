@@ -0,0 +1,469 @@
+import argparse
+import glob
+import json
+import logging
+import os
+import resource
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import feedparser
+
+from fast_feed import parse_feed
+from scraper import NewsScaper
+
+logger = logging.getLogger(__name__)
+
+# Parser configurations compared by the parser benchmark: (label, parser, partial_parse)
+PARSER_CONFIGS = [
+    ('html.parser (full tree)', 'html.parser', False),
+    ('lxml (full tree)', 'lxml', False),
+    ('lxml (partial tree)', 'lxml', True)
+]
+
+MANIFEST = 'manifest.json'
+
+def offline_scraper(**kwargs):
+    """NewsScaper with persistence, caching and pacing disabled for repeatable timings"""
+    options = {
+        'validator_path': None,
+        'seen_path': None,
+        'cache_dir': None,
+        'redirect_path': None,
+        'rate_limit': 1000.0,
+        'burst': 1000
+    }
+    options.update(kwargs)
+    return NewsScaper(**options)
+
+def load_html_fixtures(fixtures_dir):
+    """Load saved HTML pages from a fixtures directory"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, '**', '*.html'), recursive=True)):
+        with open(path, 'rb') as f:
+            pages.append((path, f.read()))
+    return pages
+
+def percentiles(samples):
+    """p50/p90/p99 of a list of durations, in milliseconds"""
+    if not samples:
+        return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0}
+    if len(samples) == 1:
+        value = samples[0] * 1000
+        return {'p50': value, 'p90': value, 'p99': value}
+
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {'p50': cuts[49] * 1000, 'p90': cuts[89] * 1000, 'p99': cuts[98] * 1000}
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def bench_parsers(fixtures_dir, repeat=3):
+    """Measure pages/sec of the HTML extractors for each parser configuration"""
+    pages = load_html_fixtures(fixtures_dir)
+    if not pages:
+        print(f"No HTML fixtures found in {fixtures_dir}")
+        return {}
+
+    results = {}
+    for label, parser, partial_parse in PARSER_CONFIGS:
+        scraper = offline_scraper(parser=parser, partial_parse=partial_parse)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for _, html in pages:
+                # Every page goes through the article and headline extractors
+                scraper.extract_article_text(html)
+                scraper.parse_website('yahoo_web', html)
+                scraper.parse_website('reuters_web', html)
+        elapsed = time.perf_counter() - start
+
+        results[label] = (len(pages) * repeat) / elapsed if elapsed else 0.0
+
+    baseline = results[PARSER_CONFIGS[0][0]]
+    print(f"📊 Parser benchmark: {len(pages)} pages x {repeat} runs")
+    for label, pages_per_sec in results.items():
+        speedup = pages_per_sec / baseline if baseline else 0.0
+        print(f"  {label:<26} {pages_per_sec:8.1f} pages/sec  ({speedup:.2f}x)")
+
+    return results
+
+def bench_feeds(fixtures_dir, repeat=5):
+    """Compare feedparser with the streaming lxml parser on recorded feeds"""
+    paths = sorted(glob.glob(os.path.join(fixtures_dir, '**', '*.xml'), recursive=True))
+    if not paths:
+        print(f"No feed fixtures found in {fixtures_dir}")
+        return {}
+
+    feeds = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            feeds.append((path, f.read()))
+
+    def fast_or_fallback(data):
+        return parse_feed(data) or feedparser.parse(data)
+
+    parsers = [('feedparser', feedparser.parse), ('lxml iterparse', fast_or_fallback)]
+    results = {}
+
+    print(f"📊 Feed parser benchmark: {len(feeds)} feeds x {repeat} runs")
+    print(f"  {'feed':<30} {'parser':<16} {'entries':>7} {'ms/feed':>9} {'peak KB':>9}")
+
+    for path, data in feeds:
+        name = os.path.relpath(path, fixtures_dir)
+        for label, parse in parsers:
+            tracemalloc.start()
+            entries = len(parse(data).entries)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                parse(data)
+            elapsed = (time.perf_counter() - start) / repeat
+
+            totals = results.setdefault(label, {'entries': 0, 'seconds': 0.0, 'peak_kb': 0.0})
+            totals['entries'] += entries
+            totals['seconds'] += elapsed
+            totals['peak_kb'] = max(totals['peak_kb'], peak / 1024)
+
+            fallback = '' if label == 'feedparser' or parse_feed(data) is not None else ' (fallback)'
+            print(f"  {name:<30} {label + fallback:<16} {entries:>7} {elapsed * 1000:>9.2f} {peak / 1024:>9.0f}")
+
+    baseline = results['feedparser']
+    for label, totals in results.items():
+        rate = totals['entries'] / totals['seconds'] if totals['seconds'] else 0.0
+        speedup = baseline['seconds'] / totals['seconds'] if totals['seconds'] else 0.0
+        totals['entries_per_sec'] = rate
+        print(f"  {label:<16} {rate:10.0f} entries/sec  ({speedup:.2f}x, peak {totals['peak_kb']:.0f} KB)")
+
+    return results
+
+def load_stored_articles(db_path, limit=200):
+    """Most recent articles (title, content, stored category) from the app database"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            'SELECT title, content, category FROM articles WHERE title IS NOT NULL ORDER BY id DESC LIMIT ?',
+            (limit,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [{'title': title, 'content': content or '', 'category': category} for title, content, category in rows]
+
+def bench_categorizers(db_path, limit=200, batch_size=8, reference='zero-shot', top_k=3):
+    """Compare full zero-shot, keyword-pruned zero-shot and embedding categorizers on stored articles.
+
+    Accuracy is agreement with the reference labels: the full 9-label
+    zero-shot output (default) or the categories stored in the database.
+    """
+    # Imported here so the scraper benchmarks do not need torch/transformers
+    from ai_analyzer import AIAnalyzer, EMBEDDING, ZERO_SHOT
+
+    sample = load_stored_articles(db_path, limit)
+    if not sample:
+        print(f"No stored articles found in {db_path}")
+        return {}
+
+    configs = [
+        (ZERO_SHOT, {'categorizer': ZERO_SHOT, 'label_top_k': None}),
+        (f"{ZERO_SHOT} top-{top_k}", {'categorizer': ZERO_SHOT, 'label_top_k': top_k}),
+        (EMBEDDING, {'categorizer': EMBEDDING})
+    ]
+
+    results = {}
+    for mode, options in configs:
+        analyzer = AIAnalyzer(batch_size=batch_size, **options)
+        if analyzer._category_model() is None:
+            print(f"❌ Could not load the {mode} categorizer model")
+            continue
+
+        times, labels = [], []
+        for article in sample:
+            start = time.perf_counter()
+            labels.append(analyzer.categorize_article(article['title'], article['content']))
+            times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        analyzer.categorize_articles(sample)
+        batched = time.perf_counter() - start
+
+        results[mode] = {
+            'labels': labels,
+            'latency_ms': percentiles(times),
+            'articles_per_sec': len(sample) / batched if batched else 0.0
+        }
+        if options['categorizer'] == ZERO_SHOT:
+            stats = analyzer.label_stats
+            results[mode]['nli_passes_per_article'] = stats['nli_passes'] / stats['articles'] if stats['articles'] else 0.0
+
+    if reference == 'stored':
+        reference_labels = [article['category'] for article in sample]
+    elif ZERO_SHOT in results:
+        reference_labels = results[ZERO_SHOT]['labels']
+    else:
+        print("❌ Zero-shot reference labels are unavailable")
+        return results
+
+    print(f"📊 Categorizer benchmark: {len(sample)} stored articles (reference: {reference} labels)")
+    baseline = results.get(ZERO_SHOT, {}).get('articles_per_sec')
+    for mode, result in results.items():
+        agree = sum(1 for label, expected in zip(result['labels'], reference_labels) if label == expected)
+        result['accuracy'] = agree / len(sample)
+        latency = result['latency_ms']
+        speedup = result['articles_per_sec'] / baseline if baseline else 0.0
+        print(f"  {mode:<16} accuracy {result['accuracy']:6.1%}  "
+              f"p50/p90 {latency['p50']:7.1f} / {latency['p90']:7.1f} ms  "
+              f"{result['articles_per_sec']:7.1f} articles/sec batched ({speedup:.2f}x)")
+        if 'nli_passes_per_article' in result:
+            print(f"  {'':<16} {result['nli_passes_per_article']:.1f} NLI passes per article")
+
+    # Most frequent disagreements show which categories the embedding prototypes confuse
+    if EMBEDDING in results:
+        mismatches = {}
+        for label, expected in zip(results[EMBEDDING]['labels'], reference_labels):
+            if label != expected:
+                mismatches[(expected, label)] = mismatches.get((expected, label), 0) + 1
+        for (expected, label), count in sorted(mismatches.items(), key=lambda item: -item[1])[:5]:
+            print(f"    {count:3d} x {expected} -> {label}")
+
+    return results
+
+def record_fixtures(out_dir, sources=None, articles_per_source=10):
+    """Capture live feed XML, listing HTML and article pages into out_dir"""
+    scraper = NewsScaper(validator_path=None, seen_path=None, cache_dir=None, redirect_path=None)
+    sources = sources or list(scraper.sources)
+    manifest = {'feeds': {}, 'web': {}, 'articles': []}
+
+    def save(relative_path, body):
+        path = os.path.join(out_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(body)
+
+    for source in sources:
+        feed_url = scraper.rss_feeds.get(source)
+        if feed_url:
+            try:
+                response = scraper._get(feed_url)
+                response.raise_for_status()
+                save(f"feeds/{source}.xml", response.content)
+                manifest['feeds'][source] = {'url': feed_url, 'path': f"feeds/{source}.xml"}
+                print(f"✅ Recorded feed for {source} ({len(response.content):,} bytes)")
+            except Exception as e:
+                print(f"❌ Could not record feed for {source}: {e}")
+
+        web_source = f"{source}_web"
+        web_url = scraper.website_urls.get(web_source)
+        if web_url:
+            try:
+                response = scraper._get(web_url)
+                response.raise_for_status()
+                save(f"web/{web_source}.html", response.content)
+                manifest['web'][web_source] = {'url': web_url, 'path': f"web/{web_source}.html"}
+                print(f"✅ Recorded listing page for {web_source} ({len(response.content):,} bytes)")
+            except Exception as e:
+                print(f"❌ Could not record listing page for {web_source}: {e}")
+
+        # Sample article pages linked from the feed (or listing page if there is no feed)
+        links = [article['url'] for article in scraper.scrape_source(source, days_back=30)]
+        for i, url in enumerate(links[:articles_per_source]):
+            try:
+                response = scraper._get(url)
+                response.raise_for_status()
+                path = f"articles/{source}/{i:03d}.html"
+                save(path, response.content)
+                manifest['articles'].append({'source': source, 'url': url, 'path': path})
+            except Exception as e:
+                print(f"❌ Could not record article {url}: {e}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"📁 Recorded {len(manifest['feeds'])} feeds, {len(manifest['web'])} listing pages "
+          f"and {len(manifest['articles'])} articles into {out_dir}")
+    return manifest
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def serve_fixtures(fixtures_dir):
+    """Start a local HTTP server for fixtures_dir, returning (server, base_url)"""
+    handler = partial(_QuietHandler, directory=fixtures_dir)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def run_benchmark(fixtures_dir, repeat=3, days_back=3650, **scraper_options):
+    """Replay recorded fixtures through the scraper and report throughput"""
+    with open(os.path.join(fixtures_dir, MANIFEST), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    server, base_url = serve_fixtures(fixtures_dir)
+    try:
+        scraper = offline_scraper(**scraper_options)
+        scraper.rss_feeds = {source: f"{base_url}/{entry['path']}" for source, entry in manifest['feeds'].items()}
+        scraper.website_urls = {source: f"{base_url}/{entry['path']}" for source, entry in manifest['web'].items()}
+        article_urls = [f"{base_url}/{entry['path']}" for entry in manifest['articles']]
+
+        feed_times, entries = [], 0
+        web_times, web_pages = [], 0
+        article_times = []
+
+        for _ in range(repeat):
+            for source in scraper.rss_feeds:
+                start = time.perf_counter()
+                entries += len(scraper.scrape_rss(source, days_back))
+                feed_times.append(time.perf_counter() - start)
+
+            for source in scraper.website_urls:
+                start = time.perf_counter()
+                scraper.scrape_website(source, days_back)
+                web_times.append(time.perf_counter() - start)
+                web_pages += 1
+
+            for url in article_urls:
+                start = time.perf_counter()
+                scraper.get_article_content(url)
+                article_times.append(time.perf_counter() - start)
+
+        # Parse-only timings on the raw bytes, without the HTTP round trip
+        parse_times = []
+        for source, entry in manifest['web'].items():
+            with open(os.path.join(fixtures_dir, entry['path']), 'rb') as f:
+                html = f.read()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                scraper.parse_website(source, html)
+                parse_times.append(time.perf_counter() - start)
+        for entry in manifest['articles']:
+            with open(os.path.join(fixtures_dir, entry['path']), 'rb') as f:
+                html = f.read()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                scraper.extract_article_text(html)
+                parse_times.append(time.perf_counter() - start)
+
+        scraper.close()
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    def rate(count, times):
+        total = sum(times)
+        return count / total if total else 0.0
+
+    results = {
+        'feed_entries_per_sec': rate(entries, feed_times),
+        'web_pages_per_sec': rate(web_pages, web_times),
+        'article_pages_per_sec': rate(len(article_times), article_times),
+        'parse_ms': percentiles(parse_times),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+    print(f"📊 Scraper benchmark: {len(manifest['feeds'])} feeds, {len(manifest['web'])} listing pages, "
+          f"{len(manifest['articles'])} articles x {repeat} runs")
+    print(f"  RSS entries/sec        {results['feed_entries_per_sec']:10.1f}")
+    print(f"  Listing pages/sec      {results['web_pages_per_sec']:10.1f}")
+    print(f"  Article pages/sec      {results['article_pages_per_sec']:10.1f}")
+    print(f"  Parse time p50/p90/p99 {results['parse_ms']['p50']:.2f} / "
+          f"{results['parse_ms']['p90']:.2f} / {results['parse_ms']['p99']:.2f} ms")
+    print(f"  Peak RSS               {results['peak_rss_mb']:10.1f} MB")
+
+    return results
+
+def compare_results(results, baseline, tolerance=0.1):
+    """Regressions of more than `tolerance` against a saved baseline"""
+    regressions = []
+    for key in ('feed_entries_per_sec', 'web_pages_per_sec', 'article_pages_per_sec'):
+        if baseline.get(key) and results[key] < baseline[key] * (1 - tolerance):
+            regressions.append(f"{key}: {results[key]:.1f} vs baseline {baseline[key]:.1f}")
+
+    p90, baseline_p90 = results['parse_ms']['p90'], baseline.get('parse_ms', {}).get('p90')
+    if baseline_p90 and p90 > baseline_p90 * (1 + tolerance):
+        regressions.append(f"parse p90: {p90:.2f} ms vs baseline {baseline_p90:.2f} ms")
+
+    return regressions
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Offline scraper benchmarks")
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+
+    parsers_cmd = subparsers.add_parser('parsers', help="Compare HTML parser backends on saved pages")
+    parsers_cmd.add_argument('--fixtures', default='fixtures', help="Directory of saved .html pages")
+    parsers_cmd.add_argument('--repeat', type=int, default=3, help="Passes over the fixture set")
+
+    feeds_cmd = subparsers.add_parser('feeds', help="Compare feedparser with the lxml feed parser")
+    feeds_cmd.add_argument('--fixtures', default='fixtures', help="Directory of recorded .xml feeds")
+    feeds_cmd.add_argument('--repeat', type=int, default=5, help="Parses per feed")
+
+    categorizers_cmd = subparsers.add_parser('categorizers', help="Compare zero-shot and embedding categorizers")
+    categorizers_cmd.add_argument('--db', default='data/news.db', help="App database to sample articles from")
+    categorizers_cmd.add_argument('--limit', type=int, default=200, help="Number of most recent articles")
+    categorizers_cmd.add_argument('--batch-size', type=int, default=8, help="Batch size for the batched pass")
+    categorizers_cmd.add_argument('--reference', choices=['zero-shot', 'stored'], default='zero-shot',
+                                  help="Labels to measure accuracy against")
+    categorizers_cmd.add_argument('--top-k', type=int, default=3, help="Candidate labels kept by keyword pruning")
+
+    record_cmd = subparsers.add_parser('record', help="Record live feeds and pages as fixtures")
+    record_cmd.add_argument('--out', default='fixtures', help="Fixtures directory to write")
+    record_cmd.add_argument('--sources', nargs='*', help="Sources to record (default: all)")
+    record_cmd.add_argument('--articles', type=int, default=10, help="Article pages per source")
+
+    run_cmd = subparsers.add_parser('run', help="Replay recorded fixtures through the scraper")
+    run_cmd.add_argument('--fixtures', default='fixtures', help="Recorded fixtures directory")
+    run_cmd.add_argument('--repeat', type=int, default=3, help="Passes over the fixture set")
+    run_cmd.add_argument('--parser', default=None, help="HTML parser backend to use")
+    run_cmd.add_argument('--parse-workers', type=int, default=0, help="Parse HTML in this many worker processes")
+    run_cmd.add_argument('--save', help="Write results as JSON to this file")
+    run_cmd.add_argument('--compare', help="Fail if results regress against this JSON baseline")
+    run_cmd.add_argument('--tolerance', type=float, default=0.1, help="Allowed regression (fraction)")
+
+    args = arg_parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == 'parsers':
+        bench_parsers(args.fixtures, args.repeat)
+
+    elif args.command == 'feeds':
+        bench_feeds(args.fixtures, args.repeat)
+
+    elif args.command == 'categorizers':
+        bench_categorizers(args.db, args.limit, args.batch_size, args.reference, args.top_k)
+
+    elif args.command == 'record':
+        record_fixtures(args.out, args.sources, args.articles)
+
+    elif args.command == 'run':
+        options = {'parser': args.parser} if args.parser else {}
+        if args.parse_workers:
+            options['parse_workers'] = args.parse_workers
+        results = run_benchmark(args.fixtures, args.repeat, **options)
+
+        if args.save:
+            with open(args.save, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+
+        if args.compare:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                regressions = compare_results(results, json.load(f), args.tolerance)
+            for regression in regressions:
+                print(f"❌ Regression: {regression}")
+            if regressions:
+                sys.exit(1)
+            print("✅ No regressions against baseline")
+
+if __name__ == '__main__':
+    main()
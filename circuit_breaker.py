@@ -0,0 +1,142 @@
+import logging
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting a host whose circuit is open"""
+
+class HostCircuit:
+    """Latency and error history for one host"""
+
+    def __init__(self, window):
+        self.state = CLOSED
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def p95_latency(self):
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+class CircuitBreaker:
+    """Per-host circuit breaker with timeouts derived from observed latency.
+
+    A host's circuit opens after `failure_threshold` consecutive failures,
+    or when more than `max_error_rate` of the recent window failed. While
+    open, requests fail instantly; after `reset_timeout` seconds a single
+    half-open probe is let through and its outcome closes or reopens the
+    circuit. Timeouts are `timeout_multiplier` x the p95 latency, clamped
+    to [min_timeout, max_timeout], once `min_samples` requests succeeded.
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=60, max_error_rate=0.5,
+                 min_timeout=2.0, max_timeout=10.0, timeout_multiplier=3.0,
+                 window=50, min_samples=5):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_error_rate = max_error_rate
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.window = window
+        self.min_samples = min_samples
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, url):
+        host = urlparse(url).netloc.lower()
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = HostCircuit(self.window)
+            self._circuits[host] = circuit
+        return host, circuit
+
+    def before_request(self, url):
+        """Raise CircuitOpenError unless a request to url's host may proceed"""
+        with self._lock:
+            host, circuit = self._circuit(url)
+
+            if circuit.state == CLOSED:
+                return
+
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                circuit.state = HALF_OPEN
+                circuit.probe_in_flight = False
+
+            if circuit.state == HALF_OPEN and not circuit.probe_in_flight:
+                circuit.probe_in_flight = True
+                logger.info(f"Probing {host} after circuit was open")
+                return
+
+        raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+
+    def timeout_for(self, url):
+        """Request timeout for url's host based on its recent latency"""
+        with self._lock:
+            _, circuit = self._circuit(url)
+            if len(circuit.latencies) < self.min_samples:
+                return self.max_timeout
+            timeout = circuit.p95_latency() * self.timeout_multiplier
+
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    def record_success(self, url, latency):
+        with self._lock:
+            host, circuit = self._circuit(url)
+            circuit.latencies.append(latency)
+            circuit.outcomes.append(True)
+            circuit.consecutive_failures = 0
+
+            if circuit.state != CLOSED:
+                logger.info(f"Circuit for {host} closed")
+            circuit.state = CLOSED
+            circuit.probe_in_flight = False
+
+    def release_probe(self, url):
+        """Let another half-open probe through when one ended without a verdict (e.g. a 429)"""
+        with self._lock:
+            _, circuit = self._circuit(url)
+            if circuit.state == HALF_OPEN:
+                circuit.probe_in_flight = False
+
+    def record_failure(self, url):
+        with self._lock:
+            host, circuit = self._circuit(url)
+            circuit.outcomes.append(False)
+            circuit.consecutive_failures += 1
+
+            failures = circuit.outcomes.count(False)
+            error_rate = failures / len(circuit.outcomes)
+            too_many_errors = len(circuit.outcomes) >= self.min_samples and error_rate > self.max_error_rate
+
+            if (circuit.state == HALF_OPEN or circuit.consecutive_failures >= self.failure_threshold
+                    or too_many_errors):
+                if circuit.state != OPEN:
+                    logger.warning(f"Circuit for {host} opened after {circuit.consecutive_failures} "
+                                   f"consecutive failures ({error_rate:.0%} recent error rate)")
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probe_in_flight = False
+
+    def stats(self):
+        """State, error rate and p95 latency per host"""
+        with self._lock:
+            return {
+                host: {
+                    'state': circuit.state,
+                    'requests': len(circuit.outcomes),
+                    'error_rate': circuit.outcomes.count(False) / len(circuit.outcomes) if circuit.outcomes else 0.0,
+                    'p95_latency': circuit.p95_latency() if circuit.latencies else None
+                }
+                for host, circuit in self._circuits.items()
+            }
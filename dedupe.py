@@ -0,0 +1,126 @@
+import hashlib
+import re
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+def tokenize(text):
+    """Lowercase word tokens"""
+    return TOKEN_RE.findall((text or '').lower())
+
+def _hash64(value):
+    """Stable 64-bit hash (Python's hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def simhash(tokens, shingle_size=3, bits=64):
+    """SimHash fingerprint over word shingles; similar texts differ in few bits"""
+    if len(tokens) < shingle_size:
+        shingles = [' '.join(tokens)] if tokens else []
+    else:
+        shingles = [' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)]
+
+    # A bit is set when more than half the shingle hashes set it; counting
+    # '1's per column of the binary strings keeps the inner loop in C
+    hashes = [format(_hash64(shingle), f'0{bits}b') for shingle in shingles]
+    threshold = len(hashes) / 2
+
+    fingerprint = 0
+    for i, column in enumerate(zip(*hashes)):
+        if column.count('1') > threshold:
+            fingerprint |= 1 << (bits - 1 - i)
+    return fingerprint
+
+def hamming_distance(a, b):
+    """Number of differing bits between two fingerprints"""
+    return bin(a ^ b).count('1')
+
+class SimHashIndex:
+    """LSH index over 64-bit SimHash fingerprints.
+
+    Fingerprints are split into `bands` bit ranges; by the pigeonhole
+    principle any two within `max_distance` bits (max_distance < bands)
+    share at least one identical band, so only bucket-mates are compared.
+    """
+
+    def __init__(self, max_distance=3, bands=4, bits=64):
+        if max_distance >= bands:
+            raise ValueError("max_distance must be smaller than the number of bands")
+        self.max_distance = max_distance
+        self.bands = bands
+        self.band_bits = bits // bands
+        self._mask = (1 << self.band_bits) - 1
+        self._buckets = {}
+        self._fingerprints = {}
+
+    def _band_keys(self, fingerprint):
+        return [(band, (fingerprint >> (band * self.band_bits)) & self._mask) for band in range(self.bands)]
+
+    def query(self, fingerprint):
+        """Keys of indexed items within max_distance bits of fingerprint"""
+        candidates = set()
+        for band_key in self._band_keys(fingerprint):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        return [key for key in candidates
+                if hamming_distance(fingerprint, self._fingerprints[key]) <= self.max_distance]
+
+    def add(self, key, fingerprint):
+        self._fingerprints[key] = fingerprint
+        for band_key in self._band_keys(fingerprint):
+            self._buckets.setdefault(band_key, []).append(key)
+
+def article_text(article):
+    """Text used to fingerprint an article"""
+    return f"{article.get('title', '')} {article.get('content', '') or article.get('summary', '')}"
+
+def group_near_duplicates(articles, max_distance=3, min_tokens=20):
+    """Group near-identical articles.
+
+    Returns a list of groups, each a list of indices into articles with the
+    representative (the copy with the most text) first. Texts too short for
+    a stable fingerprint are only grouped on an exact token match.
+    """
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_j] = root_i
+
+    index = SimHashIndex(max_distance=max_distance)
+    exact = {}
+    lengths = []
+
+    for i, article in enumerate(articles):
+        tokens = tokenize(article_text(article))
+        lengths.append(len(tokens))
+
+        if len(tokens) < min_tokens:
+            key = ' '.join(tokens)
+            if key in exact:
+                union(exact[key], i)
+            elif key:
+                exact[key] = i
+            continue
+
+        fingerprint = simhash(tokens)
+        for match in index.query(fingerprint):
+            union(match, i)
+        index.add(i, fingerprint)
+
+    groups = {}
+    for i in range(len(articles)):
+        groups.setdefault(find(i), []).append(i)
+
+    result = []
+    for members in groups.values():
+        members.sort(key=lambda i: (-lengths[i], i))
+        result.append(members)
+
+    result.sort(key=lambda members: min(members))
+    return result
@@ -0,0 +1,145 @@
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+class FeedDict(dict):
+    """Dict with attribute access, mirroring the parts of feedparser's API the scraper uses"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def _text(elem):
+    """Element text, serializing child markup (e.g. Atom xhtml content) when present"""
+    if len(elem):
+        parts = [elem.text or '']
+        parts.extend(etree.tostring(child, encoding='unicode') for child in elem)
+        return ''.join(parts).strip()
+    return (elem.text or '').strip()
+
+def _parse_date(value):
+    """RFC 822 (RSS) or ISO 8601 (Atom) date as a UTC struct_time, like feedparser"""
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.utctimetuple()
+
+def _entry_from_element(elem):
+    """Pull title, link, dates, summary and content out of an <item> or <entry>"""
+    entry = FeedDict()
+
+    for child in elem:
+        name = _local_name(child.tag)
+
+        if name == 'title':
+            entry['title'] = _text(child)
+        elif name == 'link':
+            # Atom links carry the URL in href; prefer rel="alternate"
+            href = child.get('href')
+            if href:
+                if child.get('rel', 'alternate') == 'alternate' or 'link' not in entry:
+                    entry['link'] = href
+            elif child.text:
+                entry['link'] = child.text.strip()
+        elif name in ('pubDate', 'published', 'issued') or (name == 'date' and 'published_parsed' not in entry):
+            entry['published_parsed'] = _parse_date(child.text)
+        elif name in ('updated', 'modified'):
+            entry['updated_parsed'] = _parse_date(child.text)
+        elif name in ('description', 'summary'):
+            entry['summary'] = _text(child)
+            entry['description'] = entry['summary']
+        elif name in ('encoded', 'content'):
+            # Atom xhtml content is wrapped in a single <div> that is not part of the body
+            body = child[0] if child.get('type') == 'xhtml' and len(child) == 1 else child
+            entry['content'] = [FeedDict(value=_text(body))]
+        elif name == 'guid' and 'link' not in entry and child.get('isPermaLink', 'true') == 'true':
+            entry['link'] = (child.text or '').strip()
+
+    return entry
+
+def parse_feed(data, cutoff=None, stop_after_old=3):
+    """Stream-parse RSS/Atom bytes into a feedparser-like result.
+
+    Elements are cleared as soon as each entry is read. When the feed is
+    in newest-first order, parsing stops after `stop_after_old` consecutive
+    entries older than `cutoff` (a naive UTC datetime). Returns None when
+    the document cannot be parsed as a well-formed feed so the caller can
+    fall back to feedparser.
+    """
+    if etree is None:
+        return None
+
+    entries = []
+    cutoff_tuple = cutoff.timetuple() if cutoff else None
+    previous_date = None
+    ordered = True
+    old_run = 0
+    root_name = None
+
+    try:
+        context = etree.iterparse(BytesIO(data), events=('start', 'end'),
+                                  resolve_entities=False, no_network=True, huge_tree=False)
+
+        for event, elem in context:
+            name = _local_name(elem.tag)
+
+            if event == 'start':
+                if root_name is None:
+                    root_name = name
+                continue
+
+            if name not in ('item', 'entry'):
+                continue
+
+            entry = _entry_from_element(elem)
+
+            # Free the element and any already-processed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+            if 'title' not in entry or 'link' not in entry:
+                continue
+            entries.append(entry)
+
+            date = entry.get('published_parsed') or entry.get('updated_parsed')
+            if date and previous_date and date > previous_date:
+                ordered = False
+            previous_date = date or previous_date
+
+            if cutoff_tuple and date and ordered:
+                old_run = old_run + 1 if date < cutoff_tuple else 0
+                if old_run >= stop_after_old:
+                    break
+
+    except etree.XMLSyntaxError as e:
+        logger.info(f"Fast feed parser could not read feed ({e}), falling back to feedparser")
+        return None
+
+    if root_name not in ('rss', 'feed', 'RDF'):
+        return None
+
+    return FeedDict(entries=entries, bozo=False)
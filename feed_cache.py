@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+class FeedValidatorStore:
+    """Persistent ETag / Last-Modified validators keyed by feed URL"""
+
+    def __init__(self, path='data/feed_validators.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._validators = self._load()
+        # Validators from fetched feeds whose articles have not been stored yet
+        self._pending = {}
+
+    def _load(self):
+        """Load validators from disk, starting empty if the file is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading feed validators from {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        """Write validators atomically so a crash never leaves a half-written file"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._validators, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def conditional_headers(self, url):
+        """Request headers that let the server answer 304 Not Modified"""
+        with self._lock:
+            validators = self._validators.get(url, {})
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _validators_from(self, response_headers):
+        validators = {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified')
+        }
+        return {k: v for k, v in validators.items() if v}
+
+    def _apply(self, url, validators):
+        """Store validators for url under the lock, returning whether anything changed"""
+        if self._validators.get(url, {}) == validators:
+            return False
+        if validators:
+            self._validators[url] = validators
+        else:
+            self._validators.pop(url, None)
+        return True
+
+    def _save_quietly(self):
+        try:
+            self._save()
+        except Exception as e:
+            logger.error(f"Error saving feed validators to {self.path}: {e}")
+
+    def stage(self, url, response_headers):
+        """Hold a response's validators until commit(), once its articles are stored"""
+        with self._lock:
+            self._pending[url] = self._validators_from(response_headers)
+
+    def discard(self, url):
+        """Drop validators staged for url without saving them"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def commit(self, exclude=()):
+        """Save every staged validator except those for feeds in exclude"""
+        with self._lock:
+            changed = False
+            for url in [url for url in self._pending if url not in exclude]:
+                changed = self._apply(url, self._pending.pop(url)) or changed
+            if changed:
+                self._save_quietly()
+
+    def clear(self, url=None):
+        """Forget validators for one feed, or for all feeds"""
+        with self._lock:
+            if url is None:
+                self._validators = {}
+                self._pending = {}
+            else:
+                self._validators.pop(url, None)
+                self._pending.pop(url, None)
+            self._save_quietly()
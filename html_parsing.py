@@ -0,0 +1,194 @@
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from sources import SourceRule
+
+logger = logging.getLogger(__name__)
+
+# Prefer the C-based lxml parser, falling back to the stdlib one if it is missing
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# Partial-parse filter so article extraction only builds content containers (plus the headline)
+ARTICLE_STRAINER = SoupStrainer(['title', 'h1', 'article', 'main', 'section', 'div', 'p'])
+
+# Article body containers, tried in order before falling back to every <p>
+CONTENT_SELECTORS = [
+    'article',
+    '.article-body',
+    '.story-body',
+    '.content',
+    '[data-module="ArticleBody"]',
+    '.caas-body'
+]
+
+MAX_LINKS = 50
+
+# Only <link> and <script> tags matter when looking for lighter page variants
+VARIANT_STRAINER = SoupStrainer(['link', 'script'])
+
+# rel=alternate media types that point at a stripped-down copy of the page
+LIGHT_ALTERNATE_MEDIA = ('print', 'handheld')
+
+# Listing rules compiled inside each worker process, keyed by source name
+_worker_rules = {}
+
+def make_soup(markup, parser=DEFAULT_PARSER, strainer=None):
+    """Parse markup with the given backend, as a partial tree when a strainer is given"""
+    if strainer is not None:
+        return BeautifulSoup(markup, parser, parse_only=strainer)
+    return BeautifulSoup(markup, parser)
+
+def parse_article(html, url='', parser=DEFAULT_PARSER, partial_parse=True):
+    """Extract title, main text and body links from an article page.
+
+    A module-level function over plain arguments so it can run in a worker
+    process; only the compact result dict crosses the process boundary.
+    """
+    soup = make_soup(html, parser, ARTICLE_STRAINER if partial_parse else None)
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    title = ''
+    heading = soup.find('h1') or soup.find('title')
+    if heading:
+        title = heading.get_text().strip()
+
+    # Try to find main content
+    text = ""
+    content_elem = None
+    for selector in CONTENT_SELECTORS:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            text = content_elem.get_text().strip()
+            break
+
+    if not text:
+        # Fallback: get all paragraph text
+        paragraphs = soup.find_all('p')
+        text = ' '.join([p.get_text().strip() for p in paragraphs])
+
+    links = []
+    for link in (content_elem or soup).find_all('a', href=True, limit=MAX_LINKS):
+        href = link['href'].strip()
+        if href and not href.startswith(('#', 'javascript:', 'mailto:')):
+            links.append(urljoin(url, href))
+
+    return {'title': title, 'text': text, 'links': links}
+
+def _jsonld_bodies(data):
+    """Yield every articleBody in a JSON-LD document, including @graph entries"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _jsonld_bodies(item)
+    elif isinstance(data, dict):
+        body = data.get('articleBody')
+        if isinstance(body, str) and body.strip():
+            yield body.strip()
+        if '@graph' in data:
+            yield from _jsonld_bodies(data['@graph'])
+
+def find_page_variants(html, url='', parser=DEFAULT_PARSER):
+    """Lightweight alternatives advertised by a page (usually just its <head>).
+
+    Returns a dict with any of 'jsonld' (the articleBody text), 'amp'
+    (the rel=amphtml URL) and 'alternate' (a print/handheld rel=alternate
+    URL).
+    """
+    soup = make_soup(html, parser, VARIANT_STRAINER)
+    variants = {}
+
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        body = next(_jsonld_bodies(data), None)
+        if body:
+            variants['jsonld'] = body
+            break
+
+    for link in soup.find_all('link', href=True):
+        rel = [value.lower() for value in link.get('rel', [])]
+        if 'amphtml' in rel and 'amp' not in variants:
+            variants['amp'] = urljoin(url, link['href'])
+        elif ('alternate' in rel and 'alternate' not in variants
+              and any(media in link.get('media', '').lower() for media in LIGHT_ALTERNATE_MEDIA)):
+            variants['alternate'] = urljoin(url, link['href'])
+
+    return variants
+
+def parse_listing(html, name, config, parser=DEFAULT_PARSER, partial_parse=True):
+    """Article stubs from a listing page using the registry config for `name`.
+
+    The config is a plain dict so it pickles cheaply; each worker compiles
+    it into a SourceRule once and reuses it.
+    """
+    rule = _worker_rules.get(name)
+    if rule is None or rule.config != config:
+        rule = SourceRule(name, config)
+        _worker_rules[name] = rule
+
+    strainer = rule.strainer if partial_parse else None
+    return rule.extract(make_soup(html, parser, strainer))
+
+class ParsePool:
+    """Process pool that runs the HTML extractors off the calling process.
+
+    BeautifulSoup work is CPU-bound and holds the GIL, so in a web worker it
+    competes with request threads. Fetching stays on threads; the raw bytes
+    are shipped to `workers` processes and only the extracted results come
+    back. If the pool breaks (e.g. a worker is killed) parsing falls back to
+    the calling process.
+
+    With the default spawn start method every worker re-imports the
+    launching script as `__mp_main__`. Scripts that create a pool must keep
+    expensive setup (scrapers, models) behind `if __name__ == '__main__'`
+    or skip it when `__name__ == '__mp_main__'`, as app.py does.
+    """
+
+    def __init__(self, workers, start_method='spawn'):
+        self.workers = workers
+        self.start_method = start_method
+        self._executor = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None and not self._broken:
+                # spawn avoids forking a process that already runs threads
+                context = multiprocessing.get_context(self.start_method)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def run(self, func, *args):
+        """Run func(*args) in a worker process, or inline if the pool is unavailable"""
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                return executor.submit(func, *args).result()
+            except BrokenProcessPool as e:
+                logger.error(f"HTML parse pool failed, parsing in-process from now on: {e}")
+                with self._lock:
+                    self._broken = True
+                    self._executor = None
+        return func(*args)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
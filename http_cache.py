@@ -0,0 +1,204 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# zstd compresses HTML faster and smaller than zlib, but it is optional
+try:
+    import zstandard
+    DEFAULT_CODEC = 'zstd'
+except ImportError:
+    zstandard = None
+    DEFAULT_CODEC = 'zlib'
+
+def compress(data, codec):
+    """Compress bytes with the named codec"""
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+def decompress(data, codec):
+    """Decompress bytes written by compress()"""
+    if codec == 'zstd':
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+class ResponseCache:
+    """Content-addressed, compressed on-disk cache of response bodies.
+
+    Bodies are stored once per SHA-256 digest, so several URLs serving the
+    same page share a blob. Entries expire after `ttl` seconds, and the
+    least recently used ones are evicted once blobs exceed `max_bytes`.
+    """
+
+    def __init__(self, directory='data/http_cache', ttl=6 * 3600, max_bytes=200 * 1024 * 1024,
+                 codec=DEFAULT_CODEC):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.codec = codec
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False)
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                codec TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+        ''')
+        self._conn.commit()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, digest[:2], f"{digest}.bin")
+
+    def __contains__(self, url):
+        """True if a fresh body is cached for url, without reading it"""
+        with self._lock:
+            row = self._conn.execute('SELECT stored_at FROM entries WHERE url = ?', (url,)).fetchone()
+            return row is not None and time.time() - row[0] <= self.ttl
+
+    def get(self, url):
+        """Cached body for url, or None on a miss or expired entry"""
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT e.digest, e.stored_at, b.codec FROM entries e
+                JOIN blobs b ON b.digest = e.digest WHERE e.url = ?
+            ''', (url,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            digest, stored_at, codec = row
+            now = time.time()
+            if now - stored_at > self.ttl:
+                self._delete_entry(url, digest)
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            try:
+                with open(self._blob_path(digest), 'rb') as f:
+                    body = decompress(f.read(), codec)
+            except Exception as e:
+                logger.error(f"Error reading cached response for {url}: {e}")
+                self._delete_entry(url, digest)
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute('UPDATE entries SET last_access = ? WHERE url = ?', (now, url))
+            self._conn.commit()
+            self.hits += 1
+            return body
+
+    def put(self, url, body):
+        """Store body for url, evicting old entries if the cache is over size"""
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            try:
+                exists = self._conn.execute('SELECT 1 FROM blobs WHERE digest = ?', (digest,)).fetchone()
+                if not exists:
+                    data = compress(body, self.codec)
+                    path = self._blob_path(digest)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                    tmp_path = f"{path}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+
+                    self._conn.execute('INSERT INTO blobs (digest, size, codec) VALUES (?, ?, ?)',
+                                       (digest, len(data), self.codec))
+
+                previous = self._conn.execute('SELECT digest FROM entries WHERE url = ?', (url,)).fetchone()
+                self._conn.execute('''
+                    INSERT OR REPLACE INTO entries (url, digest, stored_at, last_access)
+                    VALUES (?, ?, ?, ?)
+                ''', (url, digest, now, now))
+                if previous and previous[0] != digest:
+                    self._drop_orphan_blob(previous[0])
+
+                self._evict()
+                self._conn.commit()
+
+            except Exception as e:
+                self._conn.rollback()
+                logger.error(f"Error caching response for {url}: {e}")
+
+    def _delete_entry(self, url, digest):
+        """Remove an entry, returning the bytes freed if its blob became unused"""
+        self._conn.execute('DELETE FROM entries WHERE url = ?', (url,))
+        return self._drop_orphan_blob(digest)
+
+    def _drop_orphan_blob(self, digest):
+        """Delete a blob once no entry references it, returning the bytes freed"""
+        in_use = self._conn.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone()
+        if in_use:
+            return 0
+
+        row = self._conn.execute('SELECT size FROM blobs WHERE digest = ?', (digest,)).fetchone()
+        self._conn.execute('DELETE FROM blobs WHERE digest = ?', (digest,))
+        try:
+            os.remove(self._blob_path(digest))
+        except FileNotFoundError:
+            pass
+        return row[0] if row else 0
+
+    def _evict(self):
+        """Drop least recently used entries until the blobs fit in max_bytes"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for url, digest in self._conn.execute(
+                'SELECT url, digest FROM entries ORDER BY last_access').fetchall():
+            total -= self._delete_entry(url, digest)
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        """Hit/miss counters and current cache size"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bytes': size,
+            'codec': self.codec
+        }
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for (digest,) in self._conn.execute('SELECT digest FROM blobs').fetchall():
+                try:
+                    os.remove(self._blob_path(digest))
+                except FileNotFoundError:
+                    pass
+            self._conn.execute('DELETE FROM entries')
+            self._conn.execute('DELETE FROM blobs')
+            self._conn.commit()
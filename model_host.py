@@ -0,0 +1,280 @@
+import argparse
+import logging
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+from ai_analyzer import AIAnalyzer, CATEGORIZER_MODELS, ZERO_SHOT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = os.environ.get('MODEL_HOST_ADDRESS', 'data/model_host.sock')
+DEFAULT_AUTHKEY = os.environ.get('MODEL_HOST_AUTHKEY', 'newslet-model-host').encode('utf-8')
+
+# Seconds a client waits for the host before falling back to keyword analysis
+DEFAULT_CLIENT_TIMEOUT = float(os.environ.get('MODEL_HOST_TIMEOUT', 120))
+
+# Only these fields travel to the host and back; importance is keyword-based and scored by the client
+REQUEST_FIELDS = ('title', 'content', 'url')
+RESULT_FIELDS = ('sentiment_score', 'category', 'summary')
+
+class PendingRequest:
+    """One client's articles waiting for a shared batch"""
+
+    def __init__(self, articles):
+        self.articles = articles
+        self.results = None
+        self.error = None
+        self.done = threading.Event()
+
+class ModelHost:
+    """Process that owns the AI pipelines and serves analyze requests over a Unix socket.
+
+    Every web or pipeline worker connects with a ModelClient instead of
+    loading its own copy of the models. Requests that arrive within
+    `max_wait` seconds of each other are merged into one call to
+    AIAnalyzer.analyze_articles, so concurrent workers share batches.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY, batch_size=16,
+                 max_batch_articles=64, max_wait=0.05, categorizer=ZERO_SHOT):
+        self.address = address
+        self.authkey = authkey
+        self.max_batch_articles = max_batch_articles
+        self.max_wait = max_wait
+        self.analyzer = AIAnalyzer(batch_size=batch_size, warm_up=True, categorizer=categorizer)
+        self._requests = queue.Queue()
+        self.batches = 0
+        self.articles = 0
+
+    def serve_forever(self):
+        """Accept client connections until interrupted"""
+        directory = os.path.dirname(self.address)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+
+        threading.Thread(target=self._batch_loop, name='model-batcher', daemon=True).start()
+
+        with Listener(self.address, family='AF_UNIX', authkey=self.authkey) as listener:
+            # Only the owning user may talk to the models
+            os.chmod(self.address, 0o600)
+            logger.info(f"Model host listening on {self.address}")
+
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    logger.error(f"Error accepting model client: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        """Serve one client connection until it closes"""
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                try:
+                    if not isinstance(message, dict):
+                        reply = {'ok': False, 'error': f"Malformed request of type {type(message).__name__}"}
+                    elif message.get('op') == 'analyze':
+                        articles = self._validate_articles(message.get('articles'))
+                        reply = {'ok': True, 'results': self.submit(articles)}
+                    elif message.get('op') == 'info':
+                        info = self.analyzer.get_model_info()
+                        info['batches'] = self.batches
+                        info['articles'] = self.articles
+                        reply = {'ok': True, 'info': info}
+                    else:
+                        reply = {'ok': False, 'error': f"Unknown operation {message.get('op')!r}"}
+                except Exception as e:
+                    logger.error(f"Error serving model request: {e}")
+                    reply = {'ok': False, 'error': str(e)}
+
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError):
+                    return
+
+    def _validate_articles(self, articles):
+        """Request payload reduced to string fields, rejecting anything that is not a list of dicts"""
+        if not isinstance(articles, list) or not all(isinstance(article, dict) for article in articles):
+            raise ValueError("Expected a list of article dicts")
+        return [{field: str(article.get(field) or '') for field in REQUEST_FIELDS} for article in articles]
+
+    def submit(self, articles):
+        """Queue articles for the next shared batch and wait for their results"""
+        if not articles:
+            return []
+
+        request = PendingRequest(articles)
+        self._requests.put(request)
+        request.done.wait()
+
+        if request.error:
+            raise RuntimeError(request.error)
+        return request.results
+
+    def _batch_loop(self):
+        """Merge requests that arrive close together and analyze them in one call"""
+        while True:
+            pending = [self._requests.get()]
+            size = len(pending[0].articles)
+            deadline = time.monotonic() + self.max_wait
+
+            while size < self.max_batch_articles:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                size += len(request.articles)
+
+            merged = []
+            try:
+                merged = [dict(article) for request in pending for article in request.articles]
+                analyzed = self.analyzer.analyze_articles(merged, dedupe=False)
+                self.batches += 1
+                self.articles += len(merged)
+
+                start = 0
+                for request in pending:
+                    end = start + len(request.articles)
+                    request.results = [{field: article.get(field) for field in RESULT_FIELDS}
+                                       for article in analyzed[start:end]]
+                    start = end
+
+            except Exception as e:
+                logger.error(f"Error analyzing batch of {len(merged)} articles: {e}")
+                for request in pending:
+                    request.error = str(e)
+
+            for request in pending:
+                request.done.set()
+
+class ModelClient(AIAnalyzer):
+    """AIAnalyzer stand-in that sends analysis to a ModelHost.
+
+    Near-duplicate grouping and keyword importance scoring stay local; only
+    the representatives' title and content go over the socket. Each thread
+    keeps its own connection. If the host cannot be reached or does not
+    answer within `timeout` seconds, articles fall back to the keyword-based
+    analysis instead of loading models here.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY, batch_size=8,
+                 timeout=DEFAULT_CLIENT_TIMEOUT):
+        super().__init__(batch_size=batch_size, lazy=True)
+        self.address = address
+        self.authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _load_model(self, name):
+        # Models live in the host process; local fallbacks are keyword-based
+        return None
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = Client(self.address, family='AF_UNIX', authkey=self.authkey)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self):
+        conn, self._local.conn = getattr(self._local, 'conn', None), None
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def _request(self, message):
+        """Send a message to the host and return its reply, reconnecting once on a broken connection"""
+        for attempt in range(2):
+            try:
+                conn = self._connection()
+                conn.send(message)
+                if not conn.poll(self.timeout):
+                    # A late reply would be read by the next request, so drop the connection
+                    self._drop_connection()
+                    raise TimeoutError(f"Model host did not answer within {self.timeout}s")
+                reply = conn.recv()
+                break
+            except TimeoutError:
+                raise
+            except (EOFError, OSError):
+                self._drop_connection()
+                if attempt:
+                    raise
+
+        if not reply.get('ok'):
+            raise RuntimeError(reply.get('error', 'Model host request failed'))
+        return reply
+
+    def analyze_articles(self, articles, dedupe=True, batch_size=None):
+        """Analyze articles on the model host, deduplicating locally first"""
+        if dedupe and len(articles) > 1:
+            return self.analyze_deduplicated(articles, batch_size)
+        if not articles:
+            return articles
+
+        payload = [{field: article.get(field, '') for field in REQUEST_FIELDS} for article in articles]
+
+        try:
+            results = self._request({'op': 'analyze', 'articles': payload})['results']
+        except Exception as e:
+            logger.error(f"Model host unavailable, using keyword analysis: {e}")
+            return super().analyze_articles(articles, dedupe=False, batch_size=1)
+
+        for article, result in zip(articles, results):
+            for field in RESULT_FIELDS:
+                article[field] = result.get(field)
+            article['importance_score'] = self.calculate_importance_score(
+                article.get('title', ''), article.get('content', ''))
+
+        return articles
+
+    def get_model_info(self):
+        """Model readiness as reported by the host"""
+        try:
+            info = self._request({'op': 'info'})['info']
+            info['host'] = self.address
+            return info
+        except Exception as e:
+            logger.error(f"Error reading model host info: {e}")
+            return {'host': self.address, 'ready': False, 'error': str(e)}
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Serve the AI models to other processes over a Unix socket")
+    arg_parser.add_argument('--address', default=DEFAULT_ADDRESS, help="Unix socket path")
+    arg_parser.add_argument('--batch-size', type=int, default=16, help="Texts per model batch")
+    arg_parser.add_argument('--max-batch-articles', type=int, default=64, help="Articles merged into one analysis call")
+    arg_parser.add_argument('--categorizer', choices=list(CATEGORIZER_MODELS), default=ZERO_SHOT,
+                            help="Zero-shot NLI or single-pass embedding categorization")
+    arg_parser.add_argument('--max-wait', type=float, default=0.05, help="Seconds to wait for more requests to merge")
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    host = ModelHost(args.address, batch_size=args.batch_size,
+                     max_batch_articles=args.max_batch_articles, max_wait=args.max_wait,
+                     categorizer=args.categorizer)
+    print(f"🤖 Model host starting on {args.address}")
+    try:
+        host.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Model host stopped")
+
+if __name__ == '__main__':
+    main()
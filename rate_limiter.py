@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts up to `burst`"""
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add tokens earned since the last update; none accrue during a block"""
+        start = max(now, self.blocked_until)
+        if start > self.updated:
+            self.tokens = min(self.burst, self.tokens + (start - self.updated) * self.rate)
+            self.updated = start
+
+    def reserve(self):
+        """Take a token and return how many seconds the caller must wait to use it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            self.tokens -= 1
+            ready_at = self.updated + max(0.0, -self.tokens) / self.rate
+
+        return max(0.0, ready_at - now)
+
+    def acquire(self):
+        """Block until a token is available, returning the time waited"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def block_for(self, seconds):
+        """Hold all requests for `seconds`, e.g. after a Retry-After response"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            until = now + seconds
+            if until > self.blocked_until:
+                self.blocked_until = until
+                self.updated = max(self.updated, until)
+                self.tokens = min(self.tokens, 0.0)
+
+class HostRateLimiter:
+    """Per-host token buckets shared by every request a scraper makes"""
+
+    def __init__(self, rate=2.0, burst=5, host_limits=None):
+        self.rate = rate
+        self.burst = burst
+        # host -> (rate, burst) overrides for sites that need gentler treatment
+        self.host_limits = dict(host_limits or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        """Bucket for the host of url, created on first use"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url):
+        """Wait until a request to url's host is allowed"""
+        return self._bucket(url).acquire()
+
+    def defer(self, url, seconds):
+        """Pause all requests to url's host for `seconds`"""
+        logger.info(f"Backing off {urlparse(url).netloc} for {seconds:.1f}s")
+        self._bucket(url).block_for(seconds)
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
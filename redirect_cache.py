@@ -0,0 +1,95 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+class RedirectCache:
+    """Persistent map from redirecting URLs (short links, tracking hops) to their final URL.
+
+    Keys are canonical URLs, so every spelling of a known link resolves
+    without a network round trip. Entries older than `max_age` seconds
+    are ignored and removed by prune().
+    """
+
+    def __init__(self, path='data/redirects.db', max_age=30 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._memory = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS redirects (
+                url TEXT PRIMARY KEY,
+                final_url TEXT NOT NULL,
+                resolved_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def get(self, url):
+        """Final URL recorded for url, or None if it has not been resolved"""
+        key = canonicalize_url(url)
+        if not key:
+            return None
+
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+            row = self._conn.execute('SELECT final_url, resolved_at FROM redirects WHERE url = ?',
+                                     (key,)).fetchone()
+            final_url = row[0] if row and time.time() - row[1] < self.max_age else None
+            if final_url:
+                self._memory[key] = final_url
+            return final_url
+
+    def resolve(self, url):
+        """Final URL for url if known, otherwise url itself"""
+        return self.get(url) or url
+
+    def put_chain(self, urls, final_url):
+        """Record that every URL in a redirect chain ends at final_url"""
+        final_key = canonicalize_url(final_url)
+        keys = {canonicalize_url(url) for url in urls} - {final_key, ''}
+        if not keys:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO redirects (url, final_url, resolved_at) VALUES (?, ?, ?)',
+                                   [(key, final_url, now) for key in keys])
+            self._conn.commit()
+            for key in keys:
+                self._memory[key] = final_url
+
+    def put(self, url, final_url):
+        """Record a single resolved redirect"""
+        self.put_chain([url], final_url)
+
+    def prune(self):
+        """Forget redirects resolved more than max_age seconds ago"""
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM redirects WHERE resolved_at < ?', (cutoff,))
+            self._conn.commit()
+            self._memory.clear()
+            return cursor.rowcount
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM redirects').fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,67 @@
+import logging
+import re
+import threading
+
+from articles import LazyArticle
+
+logger = logging.getLogger(__name__)
+
+# A trailing '*' marks a stem that also matches longer words ("bank*" -> bankers, bankruptcy)
+FINANCIAL_KEYWORDS = [
+    'stock*', 'market*', 'trading', 'invest*', 'financ*', 'econom*',
+    'earnings', 'revenue', 'profit*', 'loss', 'dividend', 'IPO',
+    'merger', 'acquisition', 'SEC', 'FDA', 'bank*', 'interest rate',
+    'inflation*', 'GDP', 'unemployment', 'fed', 'federal reserve',
+    'cryptocurrenc*', 'bitcoin', 'nasdaq', 'dow jones', 's&p 500'
+]
+
+def _keyword_pattern(keyword):
+    if keyword.endswith('*'):
+        return re.escape(keyword[:-1]) + r'\w*'
+    return re.escape(keyword)
+
+def compile_keywords(keywords):
+    """One case-insensitive regex matching any keyword as a whole word (plurals included, stems by prefix)"""
+    # Longest first so multi-word phrases win over their prefixes
+    alternatives = '|'.join(_keyword_pattern(keyword) for keyword in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(rf"(?<![\w&])(?:{alternatives})(?:s|es)?(?![\w&])", re.IGNORECASE)
+
+class RelevanceGate:
+    """Cheap keyword gate that keeps non-financial articles away from the models"""
+
+    def __init__(self, keywords=None):
+        self.pattern = compile_keywords(keywords or FINANCIAL_KEYWORDS)
+        self.passed = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def matches(self, *texts):
+        """True if any text contains a financial keyword"""
+        return any(text and self.pattern.search(text) for text in texts)
+
+    def is_relevant(self, article):
+        """Check the cheap fields first; content is only read if it is already loaded"""
+        if self.matches(article.get('title', ''), article.get('summary', '')):
+            return True
+        # Feed entries carry the entry text in 'summary', so an unloaded record is judged on that alone
+        if isinstance(article, LazyArticle) and not article.is_loaded:
+            return False
+        return self.matches(article.get('content', ''))
+
+    def filter(self, articles):
+        """Articles that pass the gate; drop counts accumulate on the gate"""
+        kept = [article for article in articles if self.is_relevant(article)]
+        dropped = len(articles) - len(kept)
+
+        with self._lock:
+            self.passed += len(kept)
+            self.dropped += dropped
+
+        if dropped:
+            logger.info(f"Relevance gate dropped {dropped}/{len(articles)} non-financial articles")
+        return kept
+
+    def stats(self):
+        """Totals since the gate was created"""
+        with self._lock:
+            return {'passed': self.passed, 'dropped': self.dropped}
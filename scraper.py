@@ -1,111 +1,519 @@
 import requests
-from bs4 import BeautifulSoup
 import feedparser
 from datetime import datetime, timedelta
 import time
 import logging
-from urllib.parse import urljoin, urlparse
-import re
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import partial
+from urllib.parse import urlparse
+from feed_cache import FeedValidatorStore
+from seen_store import SeenUrlStore
+from rate_limiter import HostRateLimiter, parse_retry_after
+from http_cache import ResponseCache
+from relevance import RelevanceGate
+from sources import load_sources, compile_sources
+from circuit_breaker import CircuitBreaker
+from transport import HttpTransport, ResponseTooLargeError
+from articles import LazyArticle
+from fast_feed import parse_feed
+from redirect_cache import RedirectCache
+from url_utils import canonicalize_url
+from html_parsing import DEFAULT_PARSER, ParsePool, make_soup, parse_article, parse_listing, find_page_variants
 
 logger = logging.getLogger(__name__)
 
+# Lightweight variant lookups tried per source before giving up on a source that never has one
+VARIANT_PROBE_LIMIT = 10
+
+# Days a seen URL is remembered; always longer than the scrape window so old entries never reappear
+SEEN_MAX_AGE_DAYS = 30
+
+# Error reported for article fetches cut off by the enrichment time budget
+BUDGET_EXCEEDED = 'Time budget exceeded'
+
 class NewsScaper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def __init__(self, max_workers=8, per_host_limit=2, timeout=10, min_timeout=2,
+                 validator_path='data/feed_validators.json', article_workers=16,
+                 parser=DEFAULT_PARSER, partial_parse=True, seen_path='data/seen_urls.db',
+                 rate_limit=2.0, burst=5, host_rate_limits=None, max_retry_after=60,
+                 cache_dir='data/http_cache', cache_ttl=6 * 3600, cache_max_bytes=200 * 1024 * 1024,
+                 sources_path=None, transport=None, host_pool_sizes=None,
+                 max_response_bytes=5 * 1024 * 1024, fast_feeds=True, parse_workers=0,
+                 redirect_path='data/redirects.db', lightweight=True):
+        self.max_workers = max_workers
+        self.article_workers = article_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+
+        # HTML parser backend for BeautifulSoup and whether to build partial trees
+        self.parser = parser
+        self.partial_parse = partial_parse
+
+        # Optional process pool for HTML extraction so parsing does not hold this process's GIL (0 disables)
+        self.parse_pool = ParsePool(parse_workers) if parse_workers else None
+
+        # Streaming lxml feed parser, falling back to feedparser for malformed feeds
+        self.fast_feeds = fast_feeds
+
+        # Per-host semaphores cap concurrent requests to any single site
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+
+        # Per-host token buckets pace every request; Retry-After pauses a host
+        self.rate_limiter = HostRateLimiter(rate_limit, burst, host_rate_limits)
+        self.max_retry_after = max_retry_after
+
+        # Per-host circuits skip failing hosts; timeouts follow observed p95 latency up to `timeout`
+        self.circuit_breaker = CircuitBreaker(min_timeout=min_timeout, max_timeout=timeout)
+
+        # ETag / Last-Modified store for conditional feed requests (None disables)
+        self.feed_validators = FeedValidatorStore(validator_path) if validator_path else None
+
+        # URLs processed by earlier runs are skipped before any extraction (None disables)
+        self.seen_urls = SeenUrlStore(seen_path) if seen_path else None
+
+        # Known redirect chains (feed short links, tracking hops) resolved without a round trip (None disables)
+        self.redirects = RedirectCache(redirect_path) if redirect_path else None
+
+        # Compressed disk cache of article pages for reruns and shared stories (None disables)
+        self.response_cache = ResponseCache(cache_dir, cache_ttl, cache_max_bytes) if cache_dir else None
+
+        # Compiled keyword matcher gating what reaches the AI models
+        self.relevance_gate = RelevanceGate()
+
+        # Pooled keep-alive transport; pass one in to share connections between scrapers
+        self.transport = transport or HttpTransport(
+            pool_maxsize=max(10, per_host_limit),
+            host_pool_sizes=host_pool_sizes,
+            max_bytes=max_response_bytes
+        )
+        self.session = self.transport.session
+
+        # Source registry, compiled once into reusable extraction rules
+        self.sources = load_sources(sources_path)
+        self.source_rules = compile_sources(self.sources)
+
+        # Article hosts per source, for picking the source's lightweight variant settings
+        self._host_sources = {host: name for name, rule in self.source_rules.items() for host in rule.hosts}
+
+        # Prefer JSON-LD / AMP / print variants of article pages where the source allows it
+        self.lightweight = lightweight
+        self._variant_stats = {}
+        self._variant_lock = threading.Lock()
 
         # RSS Feed URLs for different sources
-        self.rss_feeds = {
-            'yahoo': 'https://finance.yahoo.com/news/rssindex',
-            'reuters': 'https://feeds.reuters.com/reuters/businessNews',
-            'marketwatch': 'https://feeds.marketwatch.com/marketwatch/realtimeheadlines',
-            'cnbc': 'https://www.cnbc.com/id/100003114/device/rss/rss.html',
-            'benzinga': 'https://www.benzinga.com/feed'
-        }
+        self.rss_feeds = {name: config['feed_url'] for name, config in self.sources.items()
+                          if config.get('feed_url')}
 
         # Website scraping URLs
-        self.website_urls = {
-            'yahoo_web': 'https://finance.yahoo.com/news/',
-            'reuters_web': 'https://www.reuters.com/business/',
-            'marketwatch_web': 'https://www.marketwatch.com/newsviewer'
-        }
+        self.website_urls = {f"{name}_web": config['web_url'] for name, config in self.sources.items()
+                             if config.get('web_url')}
 
     def scrape_source(self, source, days_back=7):
-        """Scrape news from a specific source"""
+        """Scrape news from a specific source (feed validators are only saved by mark_seen)"""
         try:
-            logger.info(f"Scraping {source}...")
+            return self._scrape_source(source, days_back)
 
-            # Try RSS feed first, then fallback to web scraping
-            if source in self.rss_feeds:
-                articles = self.scrape_rss(source, days_back)
-                if articles:
-                    return articles
+        except Exception as e:
+            logger.error(f"Error scraping {source}: {e}")
+            return []
 
-            # Fallback to web scraping
-            web_source = f"{source}_web"
-            if web_source in self.website_urls:
-                return self.scrape_website(web_source, days_back)
+    def _scrape_source(self, source, days_back):
+        """Scrape a source, raising the last error if every method failed"""
+        return list(self._iter_source(source, days_back))
 
-            logger.warning(f"No scraping method available for {source}")
-            return []
+    def _iter_source(self, source, days_back):
+        """Yield a source's articles as they are parsed, raising if every method failed"""
+        logger.info(f"Scraping {source}...")
+        error = None
 
+        # Try RSS feed first, then fallback to web scraping
+        if source in self.rss_feeds:
+            cutoff = self._feed_cutoff(days_back)
+            try:
+                feed = self._fetch_feed(source, cutoff)
+            except Exception as e:
+                logger.error(f"Error scraping RSS for {source}: {e}")
+                error = e
+            else:
+                if feed is None:
+                    # Feed unchanged since the last run, nothing new to fetch
+                    return
+
+                stats = {'articles': 0, 'skipped': 0}
+                yield from self._iter_feed_articles(source, feed, cutoff, stats)
+
+                # A feed whose entries were all seen before has nothing new either
+                if stats['articles'] or stats['skipped']:
+                    return
+
+        # Fallback to web scraping
+        web_source = source if source in self.website_urls else f"{source}_web"
+        if web_source in self.website_urls:
+            yield from self._scrape_website(web_source, days_back)
+            return
+
+        if error:
+            raise error
+
+        logger.warning(f"No scraping method available for {source}")
+
+    def iter_articles(self, sources=None, days_back=7, max_workers=None, buffer_size=100):
+        """Yield articles from all sources as soon as each entry or page is parsed.
+
+        Sources are scraped concurrently; a bounded buffer keeps memory flat
+        when the consumer is slower than the scrapers. Failed sources are
+        logged and simply yield nothing. As with scrape_sources, feed
+        validators are only saved once the articles go through mark_seen.
+        """
+        if sources is None:
+            sources = self.default_sources()
+        sources = list(dict.fromkeys(sources))
+        if not sources:
+            return
+
+        buffer = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        finished = object()
+
+        def put(item):
+            # Give up once the consumer has stopped iterating
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker(source):
+            try:
+                for article in self._iter_source(source, days_back):
+                    if not put(article):
+                        break
+            except Exception as e:
+                logger.error(f"Error scraping {source}: {e}")
+            finally:
+                put(finished)
+
+        workers = max(1, min(max_workers or self.max_workers, len(sources)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stream')
+        try:
+            for source in sources:
+                executor.submit(worker, source)
+
+            remaining = len(sources)
+            while remaining:
+                item = buffer.get()
+                if item is finished:
+                    remaining -= 1
+                    continue
+                yield item
+
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+    def default_sources(self):
+        """All RSS sources plus web sources that have no RSS counterpart"""
+        web_only = [s for s in self.website_urls if s[:-len('_web')] not in self.rss_feeds]
+        return list(self.rss_feeds) + web_only
+
+    def scrape_sources(self, sources=None, days_back=7, max_workers=None, callback=None):
+        """Scrape several sources concurrently.
+
+        Returns a dict keyed by source (in input order) with 'articles',
+        'error' and 'elapsed' for each. callback(source, result) is invoked
+        as each source finishes. Conditional GET only kicks in on later
+        runs once the stored articles are passed to mark_seen, which saves
+        the feeds' ETag / Last-Modified validators.
+        """
+        if sources is None:
+            sources = self.default_sources()
+        sources = list(dict.fromkeys(sources))
+        if not sources:
+            return {}
+
+        workers = max(1, min(max_workers or self.max_workers, len(sources)))
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape') as executor:
+            futures = {executor.submit(self._timed_scrape, source, days_back): source
+                       for source in sources}
+
+            for future in as_completed(futures):
+                source = futures[future]
+                results[source] = future.result()
+                if callback:
+                    try:
+                        callback(source, results[source])
+                    except Exception as e:
+                        logger.error(f"Error in scrape callback for {source}: {e}")
+
+        return {source: results[source] for source in sources}
+
+    def _timed_scrape(self, source, days_back):
+        """Scrape one source, capturing its articles, error and duration"""
+        start = time.perf_counter()
+        articles, error = [], None
+
+        try:
+            articles = self._scrape_source(source, days_back)
         except Exception as e:
             logger.error(f"Error scraping {source}: {e}")
-            return []
+            error = str(e)
 
-    def scrape_rss(self, source, days_back):
-        """Scrape news from RSS feeds"""
-        try:
-            feed_url = self.rss_feeds[source]
-            logger.info(f"Fetching RSS feed: {feed_url}")
+        return {
+            'articles': articles,
+            'error': error,
+            'elapsed': time.perf_counter() - start
+        }
 
-            feed = feedparser.parse(feed_url)
+    def _host_slot(self, url):
+        """Semaphore limiting concurrent requests to the host of url"""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _get(self, url, **kwargs):
+        """GET url through the shared transport, respecting per-host limits.
+
+        The timeout adapts to the host's observed latency unless one is
+        passed. A 429/503 carrying a short enough Retry-After pauses the
+        host and is retried once.
+        """
+        # Hosts with an open circuit fail here instantly instead of timing out; the
+        # Retry-After retry below reuses this admission rather than probing again
+        self.circuit_breaker.before_request(url)
+        try:
+            for attempt in range(2):
+                self.rate_limiter.acquire(url)
+
+                timeout = kwargs.get('timeout') or self.circuit_breaker.timeout_for(url)
+                request_kwargs = dict(kwargs, timeout=timeout)
+
+                with self._host_slot(url):
+                    start = time.perf_counter()
+                    try:
+                        response = self.transport.get(url, **request_kwargs)
+                    except ResponseTooLargeError:
+                        # An oversized page says nothing about the host's health
+                        raise
+                    except requests.RequestException:
+                        self.circuit_breaker.record_failure(url)
+                        raise
+                    latency = time.perf_counter() - start
+
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure(url)
+                elif response.status_code != 429:
+                    self.circuit_breaker.record_success(url, latency)
+
+                if response.status_code not in (429, 503):
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is None or retry_after > self.max_retry_after:
+                    return response
+
+                self.rate_limiter.defer(url, retry_after)
+                if attempt == 0:
+                    response.close()
+
+            return response
+
+        finally:
+            # A half-open probe that ended without success or failure (429, oversize) must not block the host
+            self.circuit_breaker.release_probe(url)
+
+    def resolve_url(self, url):
+        """Final URL for url when its redirect chain is already known"""
+        if self.redirects is not None and url:
+            return self.redirects.resolve(url)
+        return url
+
+    def canonical_url(self, url):
+        """Canonical form of url's final destination; an identity key only, never fetched"""
+        return canonicalize_url(self.resolve_url(url))
+
+    def is_seen(self, url):
+        """True if url was already processed by an earlier run"""
+        return self.seen_urls is not None and url in self.seen_urls
+
+    def mark_seen(self, articles):
+        """Record articles as processed and save the validators of the feeds they came from.
+
+        Call this after the run has stored its articles. Feeds with an
+        article that missed the fetch budget keep their old validators so
+        the next run fetches them in full.
+        """
+        if self.feed_validators:
+            deferred = {self.rss_feeds.get(article.get('source')) for article in articles
+                        if article.get('budget_missed')}
+            self.feed_validators.commit(exclude=deferred)
+
+        if self.seen_urls is not None:
+            # Stories that missed the fetch budget stay unseen so the next run retries them
+            self.seen_urls.add_many(article.get('canonical_url') or article['url'] for article in articles
+                                    if article.get('url') and not article.get('budget_missed'))
+
+    def prune_stores(self, days_back=7):
+        """Drop expired seen URLs and redirects so the stores stay bounded across runs"""
+        try:
+            if self.seen_urls is not None:
+                removed = self.seen_urls.prune(max(SEEN_MAX_AGE_DAYS, days_back + 1))
+                if removed:
+                    logger.info(f"Pruned {removed} expired seen URLs")
+            if self.redirects is not None:
+                removed = self.redirects.prune()
+                if removed:
+                    logger.info(f"Pruned {removed} expired redirects")
+        except Exception as e:
+            logger.error(f"Error pruning scraper stores: {e}")
 
-            if not feed.entries:
-                logger.warning(f"No entries found in RSS feed for {source}")
-                return []
+    def _soup(self, markup, strainer=None):
+        """Parse markup with the configured backend, optionally as a partial tree"""
+        return make_soup(markup, self.parser, strainer if self.partial_parse else None)
 
-            articles = []
-            cutoff_date = datetime.now() - timedelta(days=days_back)
+    def _run_parser(self, func, *args):
+        """Run an html_parsing extractor in the parse pool, or inline without one"""
+        if self.parse_pool is not None:
+            return self.parse_pool.run(func, *args)
+        return func(*args)
 
-            for entry in feed.entries:
-                try:
-                    # Parse publication date
-                    pub_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        pub_date = datetime(*entry.updated_parsed[:6])
-
-                    # Skip old articles
-                    if pub_date and pub_date < cutoff_date:
-                        continue
-
-                    # Extract article data
-                    article = {
-                        'title': entry.title,
-                        'url': entry.link,
-                        'source': source,
-                        'published_date': pub_date.isoformat() if pub_date else None,
-                        'content': self.extract_content_from_entry(entry),
-                        'summary': entry.summary if hasattr(entry, 'summary') else ''
-                    }
-
-                    articles.append(article)
-
-                except Exception as e:
-                    logger.error(f"Error processing RSS entry: {e}")
-                    continue
+    def close(self):
+        """Shut down the parse pool and pooled connections"""
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+        self.transport.close()
 
-            logger.info(f"Scraped {len(articles)} articles from {source} RSS")
-            return articles
+    def scrape_rss(self, source, days_back):
+        """Scrape news from RSS feeds (feed validators are only saved by mark_seen)"""
+        try:
+            return self._scrape_rss(source, days_back) or []
 
         except Exception as e:
             logger.error(f"Error scraping RSS for {source}: {e}")
             return []
 
+    def _scrape_rss(self, source, days_back):
+        """Scrape news from an RSS feed, raising on fetch errors.
+
+        Returns None when the feed is reachable but has nothing new: either
+        the server reports it as not modified or every entry was already seen.
+        """
+        cutoff = self._feed_cutoff(days_back)
+        feed = self._fetch_feed(source, cutoff)
+        if feed is None:
+            return None
+
+        stats = {'articles': 0, 'skipped': 0}
+        articles = list(self._iter_feed_articles(source, feed, cutoff, stats))
+
+        if stats['skipped'] and not articles:
+            return None
+        return articles
+
+    def _feed_cutoff(self, days_back):
+        """Oldest publication time to keep, as naive UTC like feed *_parsed dates"""
+        if days_back is None:
+            return None
+        return datetime.utcnow() - timedelta(days=days_back)
+
+    def _fetch_feed(self, source, cutoff=None):
+        """Download and parse a source's feed, or None if it is not modified"""
+        feed_url = self.rss_feeds[source]
+        logger.info(f"Fetching RSS feed: {feed_url}")
+
+        headers = {}
+        if self.feed_validators:
+            # Whatever an earlier, unfinished run staged for this feed is stale now
+            self.feed_validators.discard(feed_url)
+            headers = self.feed_validators.conditional_headers(feed_url)
+        response = self._get(feed_url, headers=headers)
+
+        if response.status_code == 304:
+            logger.info(f"RSS feed for {source} not modified, skipping")
+            return None
+
+        response.raise_for_status()
+
+        feed = None
+        if self.fast_feeds:
+            feed = parse_feed(response.content, cutoff)
+
+        if feed is None:
+            # Malformed or unusual feeds go through the more forgiving feedparser
+            feed = feedparser.parse(
+                response.content,
+                response_headers={'content-type': response.headers.get('Content-Type', '')}
+            )
+
+        if feed.get('bozo') and not feed.entries:
+            raise feed.get('bozo_exception') or ValueError(f"Unreadable feed: {feed_url}")
+
+        if self.feed_validators:
+            # Saved by mark_seen once the run has stored the articles, so a crash before
+            # then cannot turn the next fetch into a 304 that hides them
+            self.feed_validators.stage(feed_url, response.headers)
+
+        return feed
+
+    def _iter_feed_articles(self, source, feed, cutoff, stats):
+        """Yield articles from parsed feed entries, counting them into stats"""
+        if not feed.entries:
+            logger.warning(f"No entries found in RSS feed for {source}")
+            return
+
+        for entry in feed.entries:
+            try:
+                url = entry.get('link')
+                key = self.canonical_url(url)
+
+                # Skip entries stored by a previous run before paying for extraction
+                if self.is_seen(key):
+                    stats['skipped'] += 1
+                    continue
+
+                # Parse publication date
+                pub_date = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    pub_date = datetime(*entry.published_parsed[:6])
+                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                    pub_date = datetime(*entry.updated_parsed[:6])
+
+                # Skip old articles
+                if pub_date and cutoff and pub_date < cutoff:
+                    continue
+
+                # Extract article data; content cleanup is deferred until something reads it
+                article = LazyArticle(
+                    partial(self.extract_content_from_entry, entry),
+                    title=entry.title,
+                    url=url,
+                    canonical_url=key,
+                    source=source,
+                    published_date=pub_date.isoformat() if pub_date else None,
+                    summary=entry.summary if hasattr(entry, 'summary') else ''
+                )
+
+            except Exception as e:
+                logger.error(f"Error processing RSS entry: {e}")
+                continue
+
+            stats['articles'] += 1
+            yield article
+
+        if stats['skipped']:
+            logger.info(f"Skipped {stats['skipped']} already-seen entries from {source} RSS")
+        logger.info(f"Scraped {stats['articles']} articles from {source} RSS")
+
     def extract_content_from_entry(self, entry):
         """Extract content from RSS entry"""
         content = ""
@@ -120,7 +528,7 @@ class NewsScaper:
 
         # Clean HTML tags
         if content:
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = self._soup(content)
             content = soup.get_text().strip()
 
         return content
@@ -128,188 +536,331 @@ class NewsScaper:
     def scrape_website(self, source, days_back):
         """Scrape news directly from websites"""
         try:
-            url = self.website_urls[source]
-            logger.info(f"Scraping website: {url}")
-
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = []
-
-            if 'yahoo' in source:
-                articles = self.scrape_yahoo_web(soup, days_back)
-            elif 'reuters' in source:
-                articles = self.scrape_reuters_web(soup, days_back)
-            elif 'marketwatch' in source:
-                articles = self.scrape_marketwatch_web(soup, days_back)
-
-            logger.info(f"Scraped {len(articles)} articles from {source} website")
-            return articles
+            return self._scrape_website(source, days_back)
 
         except Exception as e:
             logger.error(f"Error scraping website {source}: {e}")
             return []
 
-    def scrape_yahoo_web(self, soup, days_back):
-        """Scrape Yahoo Finance website"""
-        articles = []
-
-        # Look for news articles
-        news_items = soup.find_all(['h3', 'h4'], class_=re.compile(r'.*title.*|.*headline.*'))
-
-        for item in news_items[:20]:  # Limit to 20 articles
-            try:
-                link_elem = item.find('a') or item.find_parent('a')
-                if not link_elem:
-                    continue
-
-                title = item.get_text().strip()
-                url = link_elem.get('href', '')
-
-                if url.startswith('/'):
-                    url = urljoin('https://finance.yahoo.com', url)
+    def _scrape_website(self, source, days_back):
+        """Scrape news from a website, raising on fetch errors"""
+        url = self.website_urls[source]
+        logger.info(f"Scraping website: {url}")
 
-                if title and url:
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'source': 'yahoo',
-                        'published_date': datetime.now().isoformat(),
-                        'content': '',
-                        'summary': ''
-                    }
-                    articles.append(article)
+        response = self._get(url)
+        response.raise_for_status()
 
-            except Exception as e:
-                logger.error(f"Error processing Yahoo article: {e}")
-                continue
+        articles = self.parse_website(source, response.content, days_back)
 
+        logger.info(f"Scraped {len(articles)} articles from {source} website")
         return articles
 
-    def scrape_reuters_web(self, soup, days_back):
-        """Scrape Reuters website"""
-        articles = []
-
-        # Look for news articles
-        story_items = soup.find_all('div', class_=re.compile(r'.*story.*|.*article.*'))
-
-        for item in story_items[:20]:  # Limit to 20 articles
-            try:
-                title_elem = item.find(['h3', 'h4', 'h2'])
-                link_elem = item.find('a')
-
-                if not title_elem or not link_elem:
-                    continue
+    def parse_website(self, source, html, days_back=7):
+        """Extract articles from a downloaded listing page"""
+        name = source[:-len('_web')] if source.endswith('_web') else source
+        rule = self.source_rules.get(name)
+        if rule is None:
+            logger.warning(f"No extraction rules registered for {source}")
+            return []
 
-                title = title_elem.get_text().strip()
-                url = link_elem.get('href', '')
+        if self.parse_pool is not None:
+            articles = self.parse_pool.run(parse_listing, html, name, self.sources[name],
+                                           self.parser, self.partial_parse)
+        else:
+            articles = rule.extract(self._soup(html, rule.strainer))
 
-                if url.startswith('/'):
-                    url = urljoin('https://www.reuters.com', url)
+        for article in articles:
+            article['canonical_url'] = self.canonical_url(article['url'])
+        return [article for article in articles if not self.is_seen(article['canonical_url'])]
 
-                if title and url:
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'source': 'reuters',
-                        'published_date': datetime.now().isoformat(),
-                        'content': '',
-                        'summary': ''
-                    }
-                    articles.append(article)
+    def get_article_content(self, url):
+        """Fetch full article content from URL"""
+        try:
+            return self._get_article_content(url)
 
-            except Exception as e:
-                logger.error(f"Error processing Reuters article: {e}")
-                continue
+        except Exception as e:
+            logger.error(f"Error fetching article content from {url}: {e}")
+            return ""
 
-        return articles
+    def _get_article_content(self, url):
+        """Fetch and extract article content, raising on fetch errors"""
+        source = self._source_for_url(url)
 
-    def scrape_marketwatch_web(self, soup, days_back):
-        """Scrape MarketWatch website"""
-        articles = []
+        if source and self._should_try_variants(source, url):
+            text = self._get_lightweight_content(url, source)
+            if text:
+                return text
 
-        # Look for news articles
-        headline_items = soup.find_all(['h3', 'h4'], class_=re.compile(r'.*headline.*|.*title.*'))
+        body = self._fetch_page(url)
+        if source:
+            self._record_variant(source, None, len(body))
+        return self.extract_article_text(body)
 
-        for item in headline_items[:20]:  # Limit to 20 articles
-            try:
-                link_elem = item.find('a') or item.find_parent('a')
-                if not link_elem:
-                    continue
+    def _source_for_url(self, url):
+        host = urlparse(url).netloc.lower()
+        return self._host_sources.get(host)
 
-                title = item.get_text().strip()
-                url = link_elem.get('href', '')
+    def _should_try_variants(self, source, url):
+        """True when source has lightweight variants configured and they have paid off so far"""
+        if not self.lightweight or not self.source_rules[source].lightweight:
+            return False
 
-                if url.startswith('/'):
-                    url = urljoin('https://www.marketwatch.com', url)
+        # A full copy already on disk beats any variant
+        if self.response_cache is not None and self.resolve_url(url) in self.response_cache:
+            return False
 
-                if title and url:
-                    article = {
-                        'title': title,
-                        'url': url,
-                        'source': 'marketwatch',
-                        'published_date': datetime.now().isoformat(),
-                        'content': '',
-                        'summary': ''
-                    }
-                    articles.append(article)
+        with self._variant_lock:
+            stats = self._variant_stats.get(source)
+            return not stats or stats['hits'] or stats['attempts'] < VARIANT_PROBE_LIMIT
 
-            except Exception as e:
-                logger.error(f"Error processing MarketWatch article: {e}")
-                continue
+    def _get_lightweight_content(self, url, source):
+        """Article text from the source's lightweight variants, or '' to fall back to the full page.
 
-        return articles
+        Only the page's <head> is downloaded to discover JSON-LD, AMP and
+        rel=alternate variants; a configured print view is fetched directly.
+        """
+        rule = self.source_rules[source]
+        fetched = 0
 
-    def get_article_content(self, url):
-        """Fetch full article content from URL"""
         try:
-            response = self.session.get(url, timeout=10)
+            if 'print' in rule.lightweight and rule.print_url:
+                body = self._fetch_page(rule.print_url.format(url=url))
+                fetched += len(body)
+                text = self.extract_article_text(body)
+                if text:
+                    self._record_variant(source, 'print', fetched)
+                    return text
+
+            target = self.resolve_url(url)
+            response = self._get(target, stop_after=b'</head>')
             response.raise_for_status()
+            self._record_redirects(url, target, response)
+            fetched += len(response.content)
+
+            variants = find_page_variants(response.content, response.url or target, self.parser)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if 'jsonld' in rule.lightweight and variants.get('jsonld'):
+                self._record_variant(source, 'jsonld', fetched)
+                return variants['jsonld']
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            for kind in ('amp', 'alternate'):
+                if kind in rule.lightweight and variants.get(kind):
+                    body = self._fetch_page(variants[kind])
+                    fetched += len(body)
+                    text = self.extract_article_text(body)
+                    if text:
+                        self._record_variant(source, kind, fetched)
+                        return text
+
+        except Exception as e:
+            logger.info(f"Lightweight fetch failed for {url}, using the full page: {e}")
+
+        self._record_variant(source, 'miss', fetched)
+        return ''
+
+    def _record_variant(self, source, kind, size):
+        """Count a variant hit/miss (or a full-page fetch when kind is None) for source"""
+        with self._variant_lock:
+            stats = self._variant_stats.setdefault(source, {
+                'attempts': 0, 'hits': 0, 'by_kind': {}, 'variant_bytes': 0,
+                'overhead_bytes': 0, 'full_pages': 0, 'full_page_bytes': 0
+            })
+
+            if kind is None:
+                stats['full_pages'] += 1
+                stats['full_page_bytes'] += size
+                return
+
+            stats['attempts'] += 1
+            stats['by_kind'][kind] = stats['by_kind'].get(kind, 0) + 1
+            if kind == 'miss':
+                # Bytes spent discovering that no variant exists
+                stats['overhead_bytes'] += size
+            else:
+                stats['hits'] += 1
+                stats['variant_bytes'] += size
+
+    def lightweight_stats(self):
+        """Per-source variant hits and bytes saved versus fetching full pages.
+
+        Savings are estimated from the average full page size seen for the
+        source, so they are None until at least one full page was fetched.
+        """
+        with self._variant_lock:
+            report = {}
+            for source, stats in self._variant_stats.items():
+                average_full = stats['full_page_bytes'] / stats['full_pages'] if stats['full_pages'] else None
+                saved = None
+                if average_full is not None:
+                    saved = int(stats['hits'] * average_full - stats['variant_bytes'] - stats['overhead_bytes'])
+                report[source] = dict(stats, by_kind=dict(stats['by_kind']),
+                                      average_full_page_bytes=average_full, bytes_saved=saved)
+            return report
+
+    def _record_redirects(self, url, target, response):
+        """Remember the redirect chain a response went through"""
+        if self.redirects is not None and response.url and response.url != target:
+            chain = [url, target] + [hop.url for hop in response.history]
+            self.redirects.put_chain(chain, response.url)
+
+    def _fetch_page(self, url):
+        """Page body for url, served from the response cache when fresh.
+
+        Known redirects are followed from the redirect cache; new chains
+        seen on the response are recorded so later runs skip the hops.
+        """
+        target = self.resolve_url(url)
+
+        if self.response_cache is not None:
+            body = self.response_cache.get(target)
+            if body is not None:
+                return body
+
+        response = self._get(target)
+        response.raise_for_status()
+
+        self._record_redirects(url, target, response)
+
+        if self.response_cache is not None:
+            self.response_cache.put(response.url or target, response.content)
+        return response.content
+
+    def extract_article_text(self, html):
+        """Extract the main article text from a downloaded page"""
+        return self.parse_article(html)['text']
+
+    def parse_article(self, html, url=''):
+        """Title, main text and body links of a downloaded article page"""
+        return self._run_parser(parse_article, html, url, self.parser, self.partial_parse)
+
+    def fetch_article_contents(self, urls, max_workers=None, budget=None):
+        """Fetch many article bodies concurrently.
+
+        At most max_workers requests are in flight overall and per_host_limit
+        per host. URLs are started in the order given. With a `budget` in
+        seconds, fetching stops once it has elapsed: queued URLs are
+        cancelled and anything unfinished is reported with error
+        'Time budget exceeded'. Returns one dict per input URL, in input
+        order, with 'url', 'content' and 'error'.
+        """
+        urls = list(urls)
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        fetched = {}
+
+        if unique_urls:
+            workers = max(1, min(max_workers or self.article_workers, len(unique_urls)))
+            deadline = time.monotonic() + budget if budget is not None else None
+
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='article')
+            try:
+                futures = {executor.submit(self._get_article_content, url): url
+                           for url in unique_urls}
+                pending = set(futures)
+
+                while pending:
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    if not done:
+                        break
+
+                    for future in done:
+                        url = futures[future]
+                        try:
+                            fetched[url] = {'url': url, 'content': future.result(), 'error': None}
+                        except Exception as e:
+                            logger.error(f"Error fetching article content from {url}: {e}")
+                            fetched[url] = {'url': url, 'content': '', 'error': str(e)}
+
+                if pending:
+                    logger.warning(f"Fetch budget of {budget}s exhausted with {len(pending)} articles left")
+                    for future in pending:
+                        url = futures[future]
+                        fetched[url] = {'url': url, 'content': '', 'error': BUDGET_EXCEEDED}
+
+            finally:
+                # Drop queued fetches; in-flight ones finish in the background within their timeout
+                executor.shutdown(wait=deadline is None, cancel_futures=True)
+
+        return [dict(fetched[url]) if url in fetched else {'url': url, 'content': '', 'error': 'Missing URL'}
+                for url in urls]
+
+    def enrich_articles(self, articles, max_workers=None, scorer=None, budget=None):
+        """Fill in empty article content by fetching the full pages concurrently.
+
+        With a `scorer(title, summary)` (e.g. AIAnalyzer.calculate_importance_score)
+        the most important stories are fetched first, and with a `budget`
+        in seconds fetching stops once it runs out. Every fetched article
+        gets 'enriched' set to whether its body was filled in, and
+        'budget_missed' set when it was never fetched because the budget
+        ran out; only those are retried by later runs. Feed articles whose
+        content has not been extracted yet are left alone, so enrichment
+        does not force their deferred HTML cleanup.
+        """
+        pending = [article for article in articles
+                   if article.get('url') and not self._has_pending_content(article) and not article.get('content')]
+        if not pending:
+            return articles
 
-            # Try to find main content
-            content_selectors = [
-                'article',
-                '.article-body',
-                '.story-body', 
-                '.content',
-                '[data-module="ArticleBody"]',
-                '.caas-body'
-            ]
+        if scorer is not None:
+            pending.sort(key=lambda article: self._priority(article, scorer), reverse=True)
 
-            content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem.get_text().strip()
-                    break
+        logger.info(f"Fetching full content for {len(pending)} articles...")
+        results = self.fetch_article_contents([article['url'] for article in pending], max_workers, budget)
 
-            if not content:
-                # Fallback: get all paragraph text
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text().strip() for p in paragraphs])
+        for article, result in zip(pending, results):
+            if result['content']:
+                article['content'] = result['content']
+            article['enriched'] = bool(result['content'])
+            # Failed or empty pages count as processed; only budget misses are worth retrying
+            article['budget_missed'] = result['error'] == BUDGET_EXCEEDED
+            # The fetch may have revealed redirects, so refresh the identity key (url stays as fetched)
+            article['canonical_url'] = self.canonical_url(article['url'])
 
-            return content
+        return articles
 
+    def _priority(self, article, scorer):
+        """Cheap importance estimate from the headline and summary"""
+        try:
+            return scorer(article.get('title', ''), article.get('summary', ''))
         except Exception as e:
-            logger.error(f"Error fetching article content from {url}: {e}")
-            return ""
+            logger.error(f"Error scoring article {article.get('url')}: {e}")
+            return 0.0
+
+    def _has_pending_content(self, article):
+        return isinstance(article, LazyArticle) and not article.is_loaded
+
+    def dedupe_articles(self, articles):
+        """One article per canonical URL, preferring a copy whose body is filled in.
+
+        Tracking, AMP and mobile variants of a story share a canonical key
+        but not a `url`, so without this they are analyzed and saved as
+        separate rows. Articles without a URL are all kept.
+        """
+        kept = []
+        index = {}
+        for article in articles:
+            key = article.get('canonical_url') or self.canonical_url(article.get('url'))
+            if not key:
+                kept.append(article)
+            elif key not in index:
+                index[key] = len(kept)
+                kept.append(article)
+            elif not self._has_body(kept[index[key]]) and self._has_body(article):
+                kept[index[key]] = article
+
+        duplicates = len(articles) - len(kept)
+        if duplicates:
+            logger.info(f"Dropped {duplicates} articles already present under another URL")
+        return kept
+
+    def _has_body(self, article):
+        # Pending feed content counts as a body without forcing its extraction
+        return self._has_pending_content(article) or bool(article.get('content'))
 
     def is_financial_news(self, title, content):
         """Check if article is financial news"""
-        financial_keywords = [
-            'stock', 'market', 'trading', 'investment', 'finance', 'economy',
-            'earnings', 'revenue', 'profit', 'loss', 'dividend', 'IPO',
-            'merger', 'acquisition', 'SEC', 'FDA', 'bank', 'interest rate',
-            'inflation', 'GDP', 'unemployment', 'fed', 'federal reserve',
-            'cryptocurrency', 'bitcoin', 'nasdaq', 'dow jones', 's&p 500'
-        ]
-
-        text = f"{title} {content}".lower()
-        return any(keyword in text for keyword in financial_keywords)
+        return self.relevance_gate.matches(title, content)
+
+    def filter_financial(self, articles):
+        """Drop articles that are not financial news before they reach analysis"""
+        return self.relevance_gate.filter(articles)
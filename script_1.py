@@ -7,6 +7,7 @@ import threading
 import time
 from scraper import NewsScaper
 from ai_analyzer import AIAnalyzer
+from model_host import ModelClient
 from newsletter_generator import NewsletterGenerator
 import logging
 
@@ -17,10 +18,20 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
 
-# Initialize components
-scraper = NewsScaper()
-analyzer = AIAnalyzer()
-newsletter_gen = NewsletterGenerator()
+# Initialize components. Spawned ParsePool workers re-import this script as __mp_main__;
+# they only run html_parsing functions, so they must not build a scraper or load models
+if __name__ != '__mp_main__':
+    scraper = NewsScaper()
+    # With MODEL_HOST_ADDRESS set, every gunicorn worker shares the models of one model_host.py process;
+    # otherwise models load in the background so read-only endpoints are available immediately
+    if os.environ.get('MODEL_HOST_ADDRESS'):
+        analyzer = ModelClient(os.environ['MODEL_HOST_ADDRESS'])
+    else:
+        analyzer = AIAnalyzer(warm_up=True, categorizer=os.environ.get('CATEGORIZER', 'zero-shot'))
+    newsletter_gen = NewsletterGenerator()
+
+# Seconds allowed for fetching article bodies; the most important stories go first
+ENRICH_TIME_BUDGET = 60
 
 # Global variable to track scraping status
 scraping_status = {"status": "idle", "progress": 0, "message": ""}
@@ -77,34 +88,56 @@ def scrape_news_background(sources, days_back):
     try:
         scraping_status = {"status": "running", "progress": 0, "message": "Starting scraper..."}
         
-        # Scrape from each source
+        # Scrape all sources concurrently (per-host limits live in the scraper)
         total_sources = len(sources)
+        completed = []
+        scraping_status["message"] = f"Scraping {', '.join(sources)}..."
+        
+        def on_source_done(source, result):
+            completed.append(source)
+            scraping_status["message"] = f"Scraped {source} ({len(completed)}/{total_sources})"
+            scraping_status["progress"] = int((len(completed) / total_sources) * 50)  # First 50% for scraping
+        
+        results = scraper.scrape_sources(sources, days_back, callback=on_source_done)
+        
         all_articles = []
+        for source, result in results.items():
+            if result['error']:
+                logger.warning(f"Scraping {source} failed: {result['error']}")
+            all_articles.extend(result['articles'])
+        
+        # Fill in bodies for web-scraped articles that only have headlines
+        scraping_status["message"] = "Fetching article content..."
+        scraping_status["progress"] = 55
         
-        for i, source in enumerate(sources):
-            scraping_status["message"] = f"Scraping {source}..."
-            scraping_status["progress"] = int((i / total_sources) * 50)  # First 50% for scraping
-            
-            articles = scraper.scrape_source(source, days_back)
-            all_articles.extend(articles)
-            time.sleep(1)  # Be nice to servers
+        scraper.enrich_articles(all_articles, scorer=analyzer.calculate_importance_score,
+                                budget=ENRICH_TIME_BUDGET)
+        
+        # Keep non-financial items away from the models; one row per story, whatever URL it came under
+        unique_articles = scraper.dedupe_articles(all_articles)
+        financial_articles = scraper.filter_financial(unique_articles)
+        dropped = len(unique_articles) - len(financial_articles)
         
         # Analyze articles with AI
         scraping_status["message"] = "Analyzing articles with AI..."
         scraping_status["progress"] = 60
         
-        analyzed_articles = analyzer.analyze_articles(all_articles)
+        analyzed_articles = analyzer.analyze_articles(financial_articles)
         
         # Save to database
         scraping_status["message"] = "Saving to database..."
         scraping_status["progress"] = 80
         
         save_articles_to_db(analyzed_articles)
+        # Articles the gate dropped are done too; marking them keeps later runs from refetching them
+        scraper.mark_seen(all_articles)
+        scraper.prune_stores(days_back)
         
         scraping_status = {
             "status": "completed", 
             "progress": 100, 
-            "message": f"Successfully processed {len(analyzed_articles)} articles"
+            "message": f"Successfully processed {len(analyzed_articles)} articles ({dropped} non-financial dropped)",
+            "dropped": dropped
         }
         
     except Exception as e:
@@ -150,6 +183,11 @@ def get_status():
     \"\"\"Get current scraping status\"\"\"
     return jsonify(scraping_status)
 
+@app.route('/api/models')
+def get_models():
+    \"\"\"Get AI model readiness\"\"\"
+    return jsonify(analyzer.get_model_info())
+
 @app.route('/api/articles')
 def get_articles():
     \"\"\"Get articles from database\"\"\"
@@ -270,7 +308,8 @@ def get_stats():
         "total_sources": total_sources,
         "source_breakdown": source_counts,
         "average_sentiment": avg_scores[0] if avg_scores[0] else 0,
-        "average_importance": avg_scores[1] if avg_scores[1] else 0
+        "average_importance": avg_scores[1] if avg_scores[1] else 0,
+        "lightweight_pages": scraper.lightweight_stats()
     })
 
 if __name__ == '__main__':
@@ -0,0 +1,146 @@
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever canonicalize_url changes so stored keys are rewritten on open
+KEY_VERSION = 2
+
+class BloomFilter:
+    """In-memory Bloom filter: no false negatives, tunable false positive rate"""
+
+    def __init__(self, capacity=100000, error_rate=0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        """Bit positions for key using double hashing over one blake2b digest"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key):
+        """Add key to the filter"""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+class SeenUrlStore:
+    """Persistent set of article URLs already processed, fronted by a Bloom filter"""
+
+    def __init__(self, path='data/seen_urls.db', capacity=100000, error_rate=0.01):
+        self.path = path
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url TEXT PRIMARY KEY,
+                first_seen DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        self._conn.commit()
+
+        self._migrate_keys()
+        self._rebuild_filter(capacity)
+
+    def _migrate_keys(self):
+        """Rewrite rows stored under an older key scheme (e.g. normalize_url) to canonical keys"""
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= KEY_VERSION:
+            return
+
+        # Several old spellings can collapse onto one key; keep the earliest first_seen
+        rows = {}
+        for url, first_seen in self._conn.execute('SELECT url, first_seen FROM seen_urls'):
+            key = canonicalize_url(url)
+            if key and (key not in rows or (first_seen or '') < (rows[key] or '')):
+                rows[key] = first_seen
+
+        with self._conn:
+            self._conn.execute('DELETE FROM seen_urls')
+            self._conn.executemany('INSERT INTO seen_urls (url, first_seen) VALUES (?, ?)', rows.items())
+            self._conn.execute(f'PRAGMA user_version = {KEY_VERSION}')
+
+        if rows:
+            logger.info(f"Migrated {len(rows)} seen URLs to canonical keys")
+
+    def _rebuild_filter(self, capacity):
+        """Load every stored URL into a fresh Bloom filter"""
+        total = self._conn.execute('SELECT COUNT(*) FROM seen_urls').fetchone()[0]
+        self._bloom = BloomFilter(max(capacity, total * 2), self.error_rate)
+        for (url,) in self._conn.execute('SELECT url FROM seen_urls'):
+            self._bloom.add(url)
+
+    def __contains__(self, url):
+        key = canonicalize_url(url)
+        if not key:
+            return False
+
+        with self._lock:
+            # Negative answers from the filter are exact, so most new URLs never touch SQLite
+            if key not in self._bloom:
+                return False
+            row = self._conn.execute('SELECT 1 FROM seen_urls WHERE url = ?', (key,)).fetchone()
+            return row is not None
+
+    def add_many(self, urls):
+        """Mark URLs as seen"""
+        keys = [key for key in {canonicalize_url(url) for url in urls} if key]
+        if not keys:
+            return
+
+        with self._lock:
+            self._conn.executemany('INSERT OR IGNORE INTO seen_urls (url) VALUES (?)',
+                                   [(key,) for key in keys])
+            self._conn.commit()
+
+            if self._bloom.count + len(keys) > self._bloom.capacity:
+                self._rebuild_filter(self._bloom.capacity * 2)
+            else:
+                for key in keys:
+                    self._bloom.add(key)
+
+    def add(self, url):
+        """Mark a single URL as seen"""
+        self.add_many([url])
+
+    def prune(self, max_age_days=30):
+        """Forget URLs first seen more than max_age_days ago"""
+        cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM seen_urls WHERE first_seen < ?', (cutoff,))
+            self._conn.commit()
+            if cursor.rowcount:
+                self._rebuild_filter(self._bloom.capacity)
+            return cursor.rowcount
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM seen_urls').fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,150 @@
+import json
+import logging
+import re
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+
+import soupsieve
+from bs4 import SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# Declarative source definitions. Adding a site only needs an entry here (or
+# in a JSON file passed to load_sources):
+#   feed_url        RSS/Atom feed, tried first
+#   web_url         listing page scraped when the feed yields nothing
+#   base_url        prefix for relative article links
+#   item_selector   CSS selector for one headline block on the listing page
+#   title_selector  CSS selector for the title inside an item (item text if omitted)
+#   link_selector   CSS selector for the link inside an item
+#   link_in_parent  also accept an <a> wrapping the item
+#   parse_only      tags (and optional class regex) to build when parsing the page
+#   limit           maximum items taken from one page
+#   hosts           article hosts belonging to the source (base_url's host if omitted)
+#   lightweight     page variants to try before the full article page, in order:
+#                   'jsonld' (articleBody in the <head>), 'amp', 'alternate', 'print'
+#   print_url       template for the print view, e.g. '{url}?output=print'
+SOURCES = {
+    'yahoo': {
+        'feed_url': 'https://finance.yahoo.com/news/rssindex',
+        'web_url': 'https://finance.yahoo.com/news/',
+        'base_url': 'https://finance.yahoo.com',
+        'item_selector': 'h3[class*="title"], h3[class*="headline"], h4[class*="title"], h4[class*="headline"]',
+        'link_selector': 'a',
+        'link_in_parent': True,
+        'parse_only': {'tags': ['a', 'h3', 'h4']},
+        'limit': 20,
+        'lightweight': ['jsonld', 'amp']
+    },
+    'reuters': {
+        'feed_url': 'https://feeds.reuters.com/reuters/businessNews',
+        'web_url': 'https://www.reuters.com/business/',
+        'base_url': 'https://www.reuters.com',
+        'item_selector': 'div[class*="story"], div[class*="article"]',
+        'title_selector': 'h3, h4, h2',
+        'link_selector': 'a',
+        'parse_only': {'tags': ['div'], 'class': r'story|article'},
+        'limit': 20,
+        'lightweight': ['jsonld', 'amp']
+    },
+    'marketwatch': {
+        'feed_url': 'https://feeds.marketwatch.com/marketwatch/realtimeheadlines',
+        'web_url': 'https://www.marketwatch.com/newsviewer',
+        'base_url': 'https://www.marketwatch.com',
+        'item_selector': 'h3[class*="headline"], h3[class*="title"], h4[class*="headline"], h4[class*="title"]',
+        'link_selector': 'a',
+        'link_in_parent': True,
+        'parse_only': {'tags': ['a', 'h3', 'h4']},
+        'limit': 20,
+        'lightweight': ['jsonld', 'amp']
+    },
+    'cnbc': {
+        'feed_url': 'https://www.cnbc.com/id/100003114/device/rss/rss.html'
+    },
+    'benzinga': {
+        'feed_url': 'https://www.benzinga.com/feed'
+    }
+}
+
+class SourceRule:
+    """A source definition with its selectors compiled once for reuse"""
+
+    def __init__(self, name, config):
+        self.name = name
+        self.config = config
+        self.feed_url = config.get('feed_url')
+        self.web_url = config.get('web_url')
+        self.base_url = config.get('base_url') or self.web_url or ''
+        self.limit = config.get('limit', 20)
+        self.link_in_parent = config.get('link_in_parent', False)
+        self.lightweight = list(config.get('lightweight', []))
+        self.print_url = config.get('print_url')
+        self.hosts = [host.lower() for host in config.get('hosts', [])]
+        if not self.hosts and self.base_url:
+            self.hosts = [urlparse(self.base_url).netloc.lower()]
+
+        self.item_matcher = soupsieve.compile(config['item_selector']) if config.get('item_selector') else None
+        self.title_matcher = soupsieve.compile(config['title_selector']) if config.get('title_selector') else None
+        self.link_matcher = soupsieve.compile(config.get('link_selector', 'a'))
+
+        parse_only = config.get('parse_only')
+        self.strainer = None
+        if parse_only:
+            class_pattern = re.compile(parse_only['class']) if parse_only.get('class') else None
+            if class_pattern:
+                self.strainer = SoupStrainer(parse_only.get('tags'), class_=class_pattern)
+            else:
+                self.strainer = SoupStrainer(parse_only.get('tags'))
+
+    def extract(self, soup):
+        """Article stubs (title and absolute URL) from a parsed listing page"""
+        if self.item_matcher is None:
+            return []
+
+        articles = []
+        for item in self.item_matcher.select(soup, limit=self.limit):
+            try:
+                title_elem = self.title_matcher.select_one(item) if self.title_matcher else item
+                link_elem = self.link_matcher.select_one(item)
+                if link_elem is None and self.link_in_parent:
+                    link_elem = item.find_parent('a')
+
+                if not title_elem or not link_elem:
+                    continue
+
+                title = title_elem.get_text().strip()
+                url = link_elem.get('href', '')
+
+                if url.startswith('/'):
+                    url = urljoin(self.base_url, url)
+
+                if title and url:
+                    articles.append({
+                        'title': title,
+                        'url': url,
+                        'source': self.name,
+                        'published_date': datetime.now().isoformat(),
+                        'content': '',
+                        'summary': ''
+                    })
+
+            except Exception as e:
+                logger.error(f"Error processing {self.name} article: {e}")
+                continue
+
+        return articles
+
+def load_sources(path=None):
+    """Built-in sources merged with (and overridable by) definitions from a JSON file"""
+    sources = {name: dict(config) for name, config in SOURCES.items()}
+
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            for name, config in json.load(f).items():
+                sources.setdefault(name, {}).update(config)
+
+    return sources
+
+def compile_sources(sources):
+    """Compile source definitions into SourceRule objects keyed by name"""
+    return {name: SourceRule(name, config) for name, config in sources.items()}
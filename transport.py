@@ -0,0 +1,119 @@
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# urllib3 only decodes brotli when a brotli package is installed, so only ask for it then
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+# Read size used while waiting for a stop_after marker
+HEAD_CHUNK_SIZE = 8 * 1024
+
+class ResponseTooLargeError(requests.RequestException):
+    """Raised when a response body exceeds the transport's byte cap"""
+
+class HttpTransport:
+    """Pooled keep-alive HTTP client shared by the feed, listing and article paths.
+
+    The session is configured once in __init__ and never mutated afterwards;
+    per-request headers are passed per call, which keeps it safe to share
+    between worker threads. Each host gets its own connection pool, sized by
+    `host_pool_sizes` or `pool_maxsize`.
+    """
+
+    def __init__(self, pool_maxsize=10, pool_connections=32, host_pool_sizes=None,
+                 max_bytes=5 * 1024 * 1024, user_agent=DEFAULT_USER_AGENT, chunk_size=64 * 1024):
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive'
+        })
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Busy hosts get larger dedicated pools so concurrent workers reuse connections
+        for host, size in (host_pool_sizes or {}).items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self.session.mount(f'https://{host}/', host_adapter)
+            self.session.mount(f'http://{host}/', host_adapter)
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_received = 0
+
+    def get(self, url, headers=None, timeout=10, max_bytes=None, stop_after=None):
+        """GET url, streaming the body and aborting once it exceeds max_bytes.
+
+        With `stop_after` (a bytes marker such as b'</head>') reading stops
+        as soon as the marker has arrived; the response then only holds the
+        body up to that point and has `truncated` set.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        marker = stop_after.lower() if stop_after else None
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+
+        try:
+            declared = response.headers.get('Content-Length')
+            if max_bytes and declared and declared.isdigit() and int(declared) > max_bytes:
+                raise ResponseTooLargeError(f"{url} declares {int(declared):,} bytes (cap {max_bytes:,})")
+
+            chunks, size = [], 0
+            response.truncated = False
+            tail = b''
+            # Small reads when stopping early so little is pulled past the marker
+            for chunk in response.iter_content(HEAD_CHUNK_SIZE if marker else self.chunk_size):
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise ResponseTooLargeError(f"{url} exceeded {max_bytes:,} bytes")
+                chunks.append(chunk)
+
+                if marker:
+                    # Keep a little of the previous chunk so a marker split across chunks is found
+                    window = (tail + chunk).lower()
+                    if marker in window:
+                        response.truncated = True
+                        break
+                    tail = window[-len(marker):]
+
+            # Hand back a normal requests.Response with its body already read
+            response._content = b''.join(chunks)
+            response._content_consumed = True
+            if response.truncated:
+                response.close()
+
+        except Exception:
+            response.close()
+            raise
+
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += size
+
+        return response
+
+    def stats(self):
+        with self._lock:
+            return {'requests': self.requests, 'bytes_received': self.bytes_received}
+
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
@@ -0,0 +1,94 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+def normalize_url(url):
+    """Normalize a URL so trivially different spellings compare equal"""
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+
+    # Keep explicit ports unless they are the scheme default
+    netloc = host
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    # Fragments never change the fetched document
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+# Query parameters that only identify the campaign or referrer, never the document
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'cmpid', 'ncid', 'ref', 'ref_src', 'referrer', 'taid', 'yptr', 'soc_src', 'soc_trk',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'mod', 'outputtype', 'amp',
+    '.tsrc', 'tsrc', '__source', 'ito', 'smid', 'utm'
+}
+TRACKING_PREFIXES = ('utm_', 'ga_', 'hsa_', 'pk_', 'mtm_', 'at_')
+
+# Mobile hosts that serve the same story as the desktop site
+MOBILE_HOST_PREFIXES = ('m.', 'mobile.')
+
+AMP_CACHE_SUFFIX = '.cdn.ampproject.org'
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def _strip_amp_path(path):
+    """Drop AMP markers from a path: /amp/..., .../amp and .amp.html variants"""
+    if path.startswith('/amp/'):
+        path = path[len('/amp'):]
+    if path.endswith('/amp'):
+        path = path[:-len('/amp')] or '/'
+    if path.endswith('.amp.html'):
+        path = path[:-len('.amp.html')] + '.html'
+    elif path.endswith('.amp'):
+        path = path[:-len('.amp')]
+    return path
+
+def canonicalize_url(url):
+    """Canonical form of an article URL for dedupe and caching.
+
+    On top of normalize_url this removes tracking parameters, unwraps
+    Google AMP cache links, drops AMP path markers, and maps AMP (amp.)
+    and mobile (m., mobile.) hosts to www.
+    """
+    url = normalize_url(url)
+    if not url:
+        return ''
+
+    parts = urlsplit(url)
+    scheme, netloc, path = parts.scheme, parts.netloc, parts.path
+
+    # https://www-example-com.cdn.ampproject.org/c/s/example.com/story -> https://example.com/story
+    if netloc.endswith(AMP_CACHE_SUFFIX) and path.startswith('/c/'):
+        inner = path[len('/c/'):]
+        if inner.startswith('s/'):
+            inner = inner[len('s/'):]
+            scheme = 'https'
+        host, _, rest = inner.partition('/')
+        netloc, path = host.lower(), '/' + rest
+
+    # amp.cnbc.com and m.cnbc.com both serve www.cnbc.com stories
+    for prefix in ('amp.',) + MOBILE_HOST_PREFIXES:
+        if netloc.startswith(prefix):
+            netloc = 'www.' + netloc[len(prefix):]
+            break
+
+    path = _strip_amp_path(path)
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/')
+
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not _is_tracking_param(name)])
+
+    return urlunsplit((scheme, netloc, path, query, ''))